@@ -12,6 +12,9 @@ from pathlib import Path
 class ConfigManager:
     """Manages application configuration settings"""
     
+    # Saved with every config; files without it predate the migrations below
+    CONFIG_VERSION = 2
+    
     def __init__(self, config_dir: Optional[str] = None):
         """Initialize configuration manager
         
@@ -47,7 +50,7 @@ class ConfigManager:
             
             # Merge with defaults to ensure all keys exist
             default_config = self.get_default_config()
-            return self._merge_configs(default_config, config)
+            return self._merge_configs(default_config, self._migrate_config(config))
             
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading config: {e}. Using defaults.")
@@ -74,6 +77,7 @@ class ConfigManager:
             Dictionary with default configuration
         """
         return {
+            'config_version': self.CONFIG_VERSION,
             'app': {
                 'theme': 'dark',
                 'language': 'en',
@@ -92,7 +96,7 @@ class ConfigManager:
                 'timeout': 30,
                 'headless': True,
                 'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'max_concurrent': 1,
+                'max_concurrent': 5,
                 'save_screenshots': False
             },
             'export': {
@@ -127,6 +131,25 @@ class ConfigManager:
             }
         }
     
+    def _migrate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Upgrade settings saved by older versions whose defaults have changed
+        
+        Args:
+            config: Configuration as loaded from file
+            
+        Returns:
+            The same configuration, upgraded to CONFIG_VERSION
+        """
+        if config.get('config_version', 1) < 2:
+            # 1 was the old default keyword concurrency and had no UI control,
+            # so a stored 1 is the old default rather than a user choice
+            scraping = config.get('scraping')
+            if isinstance(scraping, dict) and scraping.get('max_concurrent') == 1:
+                scraping['max_concurrent'] = 5
+        
+        config['config_version'] = self.CONFIG_VERSION
+        return config
+    
     def _merge_configs(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively merge user config with defaults
         
@@ -305,6 +328,8 @@ class ConfigManager:
             with open(file_path, 'r', encoding='utf-8') as f:
                 imported_config = json.load(f)
             
+            imported_config = self._migrate_config(imported_config)
+            
             if merge:
                 self._config = self._merge_configs(self._config, imported_config)
             else:
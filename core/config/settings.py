@@ -122,6 +122,27 @@ class AppSettings:
             raise ValueError("Timeout must be between 10 and 300 seconds")
         self.config.set('scraping.timeout', int(value))
     
+    # Bounds on keywords scraped concurrently, one browser tab each
+    MIN_CONCURRENT = 1
+    MAX_CONCURRENT = 16
+    
+    @property
+    def max_concurrent(self) -> int:
+        """Get number of keywords scraped concurrently, clamped to the valid range"""
+        value = self.config.get('scraping.max_concurrent', 5)
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return 5
+        return min(max(value, self.MIN_CONCURRENT), self.MAX_CONCURRENT)
+    
+    @max_concurrent.setter
+    def max_concurrent(self, value: int):
+        """Set keyword concurrency with validation"""
+        if value < self.MIN_CONCURRENT or value > self.MAX_CONCURRENT:
+            raise ValueError("Max concurrent keywords must be between 1 and 16")
+        self.config.set('scraping.max_concurrent', int(value))
+    
     @property
     def headless_mode(self) -> bool:
         """Get headless browser mode setting"""
@@ -357,6 +378,12 @@ class AppSettings:
             if not (10 <= self.scraping_timeout <= 300):
                 errors.append("Invalid timeout setting")
             
+            # The property clamps, so check the stored value itself
+            stored_concurrent = self.config.get('scraping.max_concurrent', 5)
+            if not (isinstance(stored_concurrent, int)
+                    and self.MIN_CONCURRENT <= stored_concurrent <= self.MAX_CONCURRENT):
+                errors.append("Invalid max concurrent setting")
+            
             # Validate export format
             if self.default_export_format not in ['csv', 'json', 'xlsx']:
                 errors.append("Invalid export format")
@@ -4,8 +4,16 @@ This module provides database operations including:
 - CSVHandler: CSV file operations for saving and loading business data
 - LocalDatabase: SQLite database for caching and session management
 - DataValidator: Data validation and cleaning utilities
+- Business: Compact record type for a scraped business
+- business_fingerprint: 64-bit dedup key for (name, address) pairs
 """
 
-from .handler import CSVHandler, LocalDatabase, DataValidator
+from .handler import (
+    CSVHandler, LocalDatabase, DataValidator, Business,
+    business_fingerprint
+)
 
-__all__ = ['CSVHandler', 'LocalDatabase', 'DataValidator']
\ No newline at end of file
+__all__ = [
+    'CSVHandler', 'LocalDatabase', 'DataValidator', 'Business',
+    'business_fingerprint'
+]
\ No newline at end of file
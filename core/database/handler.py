@@ -7,16 +7,132 @@ This module provides centralized database operations including:
 """
 
 import csv
+import hashlib
 import json
+import os
+import re
 import sqlite3
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, NamedTuple
 from datetime import datetime
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None  # Fall back to hashlib.blake2b for dedup fingerprints
+
+
+# Compiled once; DataValidator runs these for every cleaned business
+_PHONE_JUNK_RE = re.compile(r'[^\d\s\-\(\)\+]')
+_RATING_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+
+
+def business_fingerprint(name: str, address: str) -> int:
+    """Compute a 64-bit fingerprint for a normalized (name, address) pair
+    
+    Args:
+        name: Normalized business name
+        address: Normalized business address
+        
+    Returns:
+        Unsigned 64-bit integer fingerprint
+    """
+    data = (name + '\x1f' + address).encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+# Column order for exported business CSV files
+FIELDNAMES = ('keyword', 'name', 'address', 'phone', 'website', 'rating', 'reviews', 'category')
+_HEADER_BYTES = (','.join(FIELDNAMES) + '\r\n').encode('utf-8')
+
+
+class Business(NamedTuple):
+    """A scraped business record, with fields in CSV column order
+    
+    Stored as a tuple rather than a dict to keep large result sets compact;
+    get() lets code written against business dicts read it unchanged.
+    """
+    keyword: str = ''
+    name: str = ''
+    address: str = ''
+    phone: str = ''
+    website: str = ''
+    rating: str = ''
+    reviews: str = ''
+    category: str = ''
+    key: int = 0  # business_fingerprint of the normalized name and address
+    
+    def get(self, field: str, default: Any = None) -> Any:
+        """Return a field by name, like dict.get"""
+        return getattr(self, field) if field in self._fields else default
+
+
+_ROW_WIDTH = len(FIELDNAMES)
+
+
+def _row_values(business) -> tuple:
+    """Return a business's CSV values in FIELDNAMES order
+    
+    Business records already store their fields in column order, so the
+    row is a tuple slice; dicts are looked up field by field.
+    """
+    if isinstance(business, Business):
+        return business[:_ROW_WIDTH]
+    return tuple(business.get(field, '') for field in FIELDNAMES)
+
+
+def _quote_if_needed(value: str) -> str:
+    """Quote a CSV field the way csv.QUOTE_MINIMAL would"""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 class CSVHandler:
     """Handler for CSV file operations"""
     
+    # Flush threshold for the buffered os.write calls
+    WRITE_CHUNK_SIZE = 1024 * 1024
+    
+    @staticmethod
+    def write_businesses(businesses: List[Dict[str, Any]], file_path: str) -> None:
+        """Write business data to CSV file, raising on failure
+        
+        Rows are rendered straight to UTF-8 bytes and flushed with os.write
+        in WRITE_CHUNK_SIZE chunks. Text that UTF-8 cannot encode, such as
+        lone surrogates from scraped pages, is written as '?' so that one
+        bad field never aborts a half-written file.
+        
+        Args:
+            businesses: List of business dictionaries
+            file_path: Path to save the CSV file
+        """
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            buf = bytearray(_HEADER_BYTES)
+            for business in businesses:
+                values = _row_values(business)
+                buf += (','.join([
+                    '' if value is None else _quote_if_needed(str(value)) for value in values
+                ]) + '\r\n').encode('utf-8', 'replace')
+                if len(buf) >= CSVHandler.WRITE_CHUNK_SIZE:
+                    CSVHandler._write_all(fd, buf)
+                    buf.clear()
+            CSVHandler._write_all(fd, buf)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _write_all(fd: int, data: bytearray) -> None:
+        """Write the whole buffer, looping over partial writes"""
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        view.release()
+    
     @staticmethod
     def save_businesses_to_csv(businesses: List[Dict[str, Any]], file_path: str) -> bool:
         """Save business data to CSV file
@@ -29,16 +145,7 @@ class CSVHandler:
             bool: True if successful, False otherwise
         """
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['keyword', 'name', 'address', 'phone', 'website', 'rating', 'reviews', 'category']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for business in businesses:
-                    # Ensure all required fields exist
-                    row = {field: business.get(field, '') for field in fieldnames}
-                    writer.writerow(row)
-                    
+            CSVHandler.write_businesses(businesses, file_path)
             return True
             
         except Exception as e:
@@ -82,14 +189,17 @@ class CSVHandler:
         unique_businesses = []
         
         for business in businesses:
-            # Create a key based on name and address (case-insensitive)
-            key = (
-                business.get('name', '').lower().strip(),
-                business.get('address', '').lower().strip()
-            )
+            # Business records carry a precomputed key; plain dicts are hashed here
+            key = getattr(business, 'key', 0)
+            if not key:
+                # Dedup on name and address (case-insensitive), skipping empty entries
+                name = business.get('name', '').strip().casefold()
+                address = business.get('address', '').strip().casefold()
+                if not name and not address:
+                    continue
+                key = business_fingerprint(name, address)
             
-            # Skip empty entries and duplicates
-            if key != ('', '') and key not in seen:
+            if key not in seen:
                 seen.add(key)
                 unique_businesses.append(business)
                 
@@ -413,8 +523,7 @@ class DataValidator:
         phone = phone.replace('tel:', '').replace('phone:', '').strip()
         
         # Keep only digits, spaces, hyphens, parentheses, and plus signs
-        import re
-        phone = re.sub(r'[^\d\s\-\(\)\+]', '', phone)
+        phone = _PHONE_JUNK_RE.sub('', phone)
         
         return phone.strip()
     
@@ -439,8 +548,7 @@ class DataValidator:
             return ''
             
         # Extract numeric rating
-        import re
-        match = re.search(r'(\d+\.?\d*)', rating)
+        match = _RATING_NUMBER_RE.search(rating)
         if match:
             return match.group(1)
             
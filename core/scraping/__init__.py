@@ -1,9 +1,10 @@
 """Google Maps Scraping Engine Module
 
 This module provides the core scraping functionality for Google Maps business data extraction.
-It includes the main scraper class and threading support for non-blocking operations.
+It includes the main scraper class, threading support for non-blocking operations
+and a browser pool that keeps Chromium warm between runs.
 """
 
-from .engine import GoogleMapsScraper, ScrapingThread
+from .engine import GoogleMapsScraper, ScrapingThread, BrowserPool
 
-__all__ = ['GoogleMapsScraper', 'ScrapingThread']
\ No newline at end of file
+__all__ = ['GoogleMapsScraper', 'ScrapingThread', 'BrowserPool']
\ No newline at end of file
@@ -3,12 +3,20 @@ import os
 import asyncio
 import threading
 import csv
-import random
+import json
+import logging
 import time
+import socket
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Optional
+from urllib.parse import quote_plus, urljoin
 import re
 
+# Per-business and per-selector trace; enable with logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
 try:
     from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 except ImportError:
@@ -24,16 +32,660 @@ except ImportError:
     print("pip install PyQt5")
     sys.exit(1)
 
+from ..database import Business, business_fingerprint
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Not available on Windows; the stdlib loop is used instead
+
+if uvloop is not None:
+    # Both asyncio.run and BrowserPool's loop pick this up
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # The panel phone scan falls back to the standard re engine
+
+
+# Chromium flags shared by every launch; the window size follows the viewport
+_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--memory-pressure-off',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions-except',
+    '--disable-extensions',
+    '--no-first-run',
+    '--disable-default-apps',
+    # Chrome keeps only the last --disable-features flag, so list them together
+    '--disable-features=TranslateUI,VizDisplayCompositor',
+    '--disable-ipc-flooding-protection',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-field-trial-config',
+    '--disable-back-forward-cache',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-sync',
+    '--disable-web-security',
+    '--blink-settings=imagesEnabled=false',
+)
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Any of these appearing means search results have rendered
+_RESULT_SELECTORS = (
+    '[role="main"]',
+    '.m6QErb',
+    '[data-result-index]',
+    'div[role="article"]',
+    '.Nv2PK',  # Additional Google Maps selectors
+    '.bJzME',
+    '.lI9IFe',
+)
+
+# Business listing elements; the first selector with visible hits wins
+_LISTING_SELECTORS = (
+    'a[data-cid]',  # Most reliable - has business ID
+    '.hfpxzc',  # Common business link class
+    'a[href*="/maps/place/"]',  # Direct place links
+    'div[role="article"] a',  # Article containers with links
+    'div[jsaction*="selectResult"]',  # Elements with select action
+    '[data-result-index] a',  # Indexed results
+    'div[role="article"]',  # Fallback to article containers
+)
+
+# Detail panel fields, each tried in order until one yields a value
+_NAME_SELECTORS = (
+    'h1[data-attrid="title"]',
+    'h1.DUwDvf',
+    '.x3AX1-LfntMc-header-title h1',
+    '[data-attrid="title"]',
+    'h1',
+    '.qBF1Pd.fontHeadlineSmall',
+)
+
+_ADDRESS_SELECTORS = (
+    '[data-item-id="address"] .Io6YTe',
+    '[data-attrid="kc:/location/location:address"]',
+    '.LrzXr',
+    '[data-value="Directions"]',
+    'button[data-value="Directions"] .Io6YTe',
+    '.rogA2c .Io6YTe',
+)
+
+_PHONE_SELECTORS = (
+    # Primary phone selectors
+    '[data-item-id="phone"] .Io6YTe',
+    'button[data-value*="tel:"] .Io6YTe',
+    'a[href^="tel:"]',
+    '[data-attrid*="phone"]',
+    # Additional comprehensive selectors
+    'button[jsaction*="phone"] .Io6YTe',
+    '.rogA2c button[data-value*="tel:"]',
+    '.CsEnBe[aria-label*="phone"]',
+    '.CsEnBe[aria-label*="Phone"]',
+    'button[aria-label*="phone"] .Io6YTe',
+    'button[aria-label*="Phone"] .Io6YTe',
+    '.Io6YTe[aria-label*="phone"]',
+    '.Io6YTe[aria-label*="Phone"]',
+    # Fallback selectors
+    'a[href*="tel:"]',
+    'span[aria-label*="phone"]',
+    'span[aria-label*="Phone"]',
+    # Generic phone pattern selectors
+    'button:has-text("+")',
+    'span:has-text("+")',
+    '.Io6YTe:has-text("+")',
+    # Contact section selectors
+    '[data-value="Call"] .Io6YTe',
+    'button[data-value="Call"] .Io6YTe',
+)
+
+# Links back to Google Maps are filtered out in the selectors themselves, so
+# they never take up one of a field's capped candidate slots
+_NOT_MAPS_LINK = '[href]:not([href*="google.com"]):not([href*="maps"])'
+
+_WEBSITE_SELECTORS = (
+    f'[data-item-id="authority"] a{_NOT_MAPS_LINK}',
+    f'a[data-value="Website"]{_NOT_MAPS_LINK}',
+    f'a[href^="http"]{_NOT_MAPS_LINK}',
+    f'[data-attrid*="website"] a{_NOT_MAPS_LINK}',
+)
+
+_RATING_SELECTORS = (
+    '.F7nice span[aria-hidden="true"]',
+    'span.ceNzKf[aria-label*="star"]',
+    '.MW4etd',
+    '[role="img"][aria-label*="star"]',
+)
+
+_REVIEW_SELECTORS = (
+    '.F7nice .RDApEe',
+    '.UY7F9',
+    'button[jsaction*="reviews"] .RDApEe',
+    '[aria-label*="review"]',
+)
+
+_CATEGORY_SELECTORS = (
+    'button[jsaction*="category"] .DkEaL',
+    '.DkEaL',
+    '[data-attrid*="category"]',
+    '.YhemCb .DkEaL',
+)
+
+# Selector lists per field, resolved in-page by window.__smReadFields
+_FIELD_SELECTORS = {
+    'name': _NAME_SELECTORS,
+    'address': _ADDRESS_SELECTORS,
+    'phone': _PHONE_SELECTORS,
+    'website': _WEBSITE_SELECTORS,
+    'rating': _RATING_SELECTORS,
+    'reviews': _REVIEW_SELECTORS,
+    'category': _CATEGORY_SELECTORS,
+}
+
+# Elements that show a business details panel has loaded
+_PANEL_INDICATORS = (
+    'h1[data-attrid="title"]',  # Business name
+    'h1.DUwDvf',  # Alternative business name
+    '[data-item-id="address"]',  # Address section
+    '.F7nice',  # Rating section
+    'h1',  # Fallback to any h1
+)
+
+# One union selector, so a single wait resolves on whichever indicator appears first
+_PANEL_SELECTOR = ', '.join(_PANEL_INDICATORS)
+
+# Phone-looking run in a phone element's text: digits with spaces, dashes,
+# parentheses and plus signs; callers keep the first run with enough digits
+_PHONE_RE = re.compile(r'[\d+\-()\s]{7,}')
+
+# Stricter international / US / grouped formats, merged into one alternation,
+# for scanning the whole panel text where loose digit runs are common. RE2,
+# when installed, matches it in linear time over long digit-heavy text.
+_PANEL_PHONE_RE = (re2 or re).compile(
+    r'\+\d{1,3}[\s\-]?\(?\d{1,4}\)?[\s\-]?\d{1,4}[\s\-]?\d{1,9}'
+    r'|\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}'
+    r'|\d{2,4}[\s\-]\d{3,4}[\s\-]\d{3,4}'
+)
+
+# Place id inside a Maps place URL's data parameter, e.g. "!1s0x89c2...:0x5f1..."
+_PLACE_ID_RE = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)', re.IGNORECASE)
+
+# Page helpers installed once per document through the context's init
+# script, so hot-path evaluate calls send a one-line call instead of
+# re-sending and re-compiling these bodies every time
+_PAGE_HELPERS_JS = """
+    // Per-element summary of listing matches; the visibility test mirrors
+    // Playwright's (non-empty box, not visibility:hidden)
+    window.__smListingInfo = els => els.map(el => {
+        const rect = el.getBoundingClientRect();
+        return {
+            text: (el.textContent || '').trim().slice(0, 100),
+            href: el.getAttribute('href') || '',
+            cid: el.getAttribute('data-cid') || '',
+            visible: rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden'
+        };
+    });
+    
+    // Scroll the results panel, wait for content and count listings
+    window.__smScrollAndCount = async (delayMs, previousCount) => {
+        // Try multiple selectors for the scrollable results panel
+        const selectors = [
+            '[role="main"]',
+            '.m6QErb',
+            '[data-value="Search results"]',
+            '.Nv2PK',
+            '.bJzME',
+            '.lI9IFe',
+            '[aria-label*="Results for"]',
+            '.section-scrollbox',
+            '.section-layout'
+        ];
+        
+        for (const selector of selectors) {
+            const panel = document.querySelector(selector);
+            if (panel && panel.scrollHeight > panel.clientHeight) {
+                panel.scrollTop += 2000;  // Aggressive scroll
+                break;
+            }
+        }
+        
+        // Also try scrolling the entire page as fallback
+        window.scrollBy(0, 1000);
+        
+        // Try to click "Show more" or "Load more" buttons if they exist
+        const moreButtons = [
+            'button[aria-label*="more"]',
+            'button[aria-label*="More"]',
+            '.VfPpkd-LgbsSe[aria-label*="more"]',
+            '[data-value="Show more results"]'
+        ];
+        
+        for (const buttonSelector of moreButtons) {
+            const button = document.querySelector(buttonSelector);
+            if (button && button.offsetParent !== null) {
+                button.click();
+                break;
+            }
+        }
+        
+        // Count current business listings with improved detection
+        const countSelectors = [
+            'div[role="article"]',
+            '.m6QErb',
+            '[data-result-index]',
+            '.Nv2PK',
+            '.bJzME',
+            '.lI9IFe',
+            'a[data-cid]',
+            '[jsaction*="pane.resultCard"]',
+            '.section-result'
+        ];
+        
+        const countListings = () => {
+            let maxCount = 0;
+            for (const selector of countSelectors) {
+                maxCount = Math.max(maxCount, document.querySelectorAll(selector).length);
+            }
+            return maxCount;
+        };
+        
+        // Maps shows an end-of-list marker once every result is loaded
+        const END_MARKER = '.HlvSq, .PbZDve';
+        const atEnd = () => !!document.querySelector(END_MARKER) ||
+            document.body.innerText.includes("You've reached the end of the list");
+        
+        const count = countListings();
+        if (count > previousCount || atEnd()) {
+            return { count, reachedEnd: atEnd() };
+        }
+        
+        // Otherwise resolve on the first DOM mutation that adds listings or
+        // the end marker, waiting at most delayMs for content to load
+        return new Promise(resolve => {
+            const finish = () => {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve({ count: countListings(), reachedEnd: atEnd() });
+            };
+            const observer = new MutationObserver(() => {
+                if (document.querySelector(END_MARKER) || countListings() > previousCount) {
+                    finish();
+                }
+            });
+            observer.observe(document.body, { childList: true, subtree: true });
+            const timer = setTimeout(finish, delayMs);
+        });
+    };
+    
+    // Selectors the engine rejected once (Playwright-only syntax other than
+    // the :has-text() suffix handled below); kept for the document's
+    // lifetime so they are not retried
+    window.__smBadSelectors = new Set();
+    
+    // Heading of the open business panel, or null when none is open
+    window.__smHeading = () => document.querySelector('h1.DUwDvf') || document.querySelector('h1');
+    
+    // Heading node, name and address on screen, as compared across a click
+    window.__smPanelState = () => {
+        const heading = window.__smHeading();
+        const address = document.querySelector('[data-item-id="address"]');
+        return {
+            heading,
+            name: heading ? (heading.textContent || '').trim() : '',
+            address: address ? (address.textContent || '').trim() : ''
+        };
+    };
+    
+    // Remember the panel shown before a click, so the wait after it can tell
+    // the newly opened business from the one already on screen
+    window.__smMarkPanel = () => {
+        window.__smPreviousPanel = window.__smPanelState();
+    };
+    
+    // Whether a panel indicator is visible and belongs to the business clicked
+    // since __smMarkPanel. Chain branches share a name, so a re-rendered
+    // heading node or a changed address counts as well as a changed name;
+    // when the URL carries a place id, it must be the clicked listing's
+    window.__smPanelReady = (selector, placeToken) => {
+        const visible = Array.from(document.querySelectorAll(selector)).some(el => {
+            const rect = el.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+        });
+        const previous = window.__smPreviousPanel;
+        if (!visible || !previous || !previous.heading) return visible;
+        
+        const current = window.__smPanelState();
+        if (!current.name) return false;
+        if (current.heading === previous.heading && current.name === previous.name
+                && (!current.address || current.address === previous.address)) {
+            return false;
+        }
+        if (placeToken) {
+            let url = location.href;
+            try {
+                url = decodeURIComponent(url);
+            } catch (e) {}
+            const placeId = /!1s(0x[0-9a-f]+:0x[0-9a-f]+)/i.exec(url);
+            if (placeId && !placeId[1].toLowerCase().includes(placeToken)) return false;
+        }
+        return true;
+    };
+    
+    // The pane holding the business heading, so lookups skip the results list
+    window.__smDetailsPane = () => {
+        const heading = window.__smHeading();
+        return (heading && heading.closest('[role="main"]')) || document.body;
+    };
+    
+    // Text of the details pane, one text node per line. Read from the DOM
+    // rather than innerText so no layout is forced; hidden nodes are
+    // included, which is harmless when scanning for phone numbers
+    window.__smPanelText = () => {
+        const walker = document.createTreeWalker(window.__smDetailsPane(), NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) {
+            parts.push(walker.currentNode.nodeValue);
+        }
+        return parts.join('\\n');
+    };
+    
+    // Details panel: the class-token fields from one DOM walk, plus the
+    // first match of every selector per field for validation in Python
+    window.__smReadFields = (selectorMap, maxCandidates) => {
+        const panel = window.__smDetailsPane();
+        
+        const TOKENS = {DUwDvf: 'name', MW4etd: 'rating', UY7F9: 'reviews', DkEaL: 'category'};
+        const NUM_RE = /[0-9]+(?:\\.[0-9]+)?/;
+        const REVIEWS_RE = /([0-9,]+)/;
+        const COMMA_RE = /,/g;
+        const found = {};
+        let remaining = 4;
+        for (const node of panel.getElementsByTagName('*')) {
+            for (const token of node.classList) {
+                const field = TOKENS[token];
+                if (field && !(field in found)) {
+                    // Star ratings carry the value in aria-label when present
+                    const text = ((field === 'rating' && node.getAttribute('aria-label'))
+                        || node.textContent || '').trim();
+                    if (text) {
+                        found[field] = text;
+                        remaining--;
+                    }
+                }
+            }
+            if (!remaining) break;
+        }
+        const rating = found.rating && NUM_RE.exec(found.rating);
+        const reviews = found.reviews && REVIEWS_RE.exec(found.reviews);
+        
+        // Playwright's trailing :has-text("...") is not CSS; it is applied
+        // here as a case-insensitive text filter over the base selector
+        const HAS_TEXT_RE = /^(.*):has-text\("([^"]*)"\)$/;
+        const select = (selector) => {
+            const hasText = HAS_TEXT_RE.exec(selector);
+            if (!hasText) return panel.querySelector(selector);
+            const needle = hasText[2].toLowerCase();
+            for (const el of panel.querySelectorAll(hasText[1])) {
+                if ((el.textContent || '').toLowerCase().includes(needle)) return el;
+            }
+            return null;
+        };
+        
+        // Selectors shared between fields are only queried once per call
+        const matched = new Map();
+        const query = (selector) => {
+            if (!matched.has(selector)) {
+                let el = null;
+                if (!window.__smBadSelectors.has(selector)) {
+                    try {
+                        el = select(selector);
+                    } catch (e) {
+                        window.__smBadSelectors.add(selector);
+                    }
+                }
+                matched.set(selector, el);
+            }
+            return matched.get(selector);
+        };
+        
+        const candidates = {};
+        for (const [field, selectors] of Object.entries(selectorMap)) {
+            const matches = candidates[field] = [];
+            for (const selector of selectors) {
+                if (matches.length >= maxCandidates) break;
+                const el = query(selector);
+                if (el) {
+                    matches.push({
+                        selector,
+                        text: el.textContent || '',
+                        href: el.getAttribute('href') || '',
+                        aria: el.getAttribute('aria-label') || ''
+                    });
+                }
+            }
+        }
+        
+        return {
+            quick: {
+                name: found.name || '',
+                rating: rating ? rating[0] : '',
+                reviews: reviews ? reviews[1].replace(COMMA_RE, '') : '',
+                category: found.category || ''
+            },
+            candidates
+        };
+    };
+    
+    // Fields shown on every result card
+    window.__smListingCards = () => {
+        const NUM_RE = /[0-9]+(?:\\.[0-9]+)?/;
+        const NON_DIGIT_RE = /[^0-9]/g;
+        const cards = [];
+        for (const card of document.querySelectorAll('div[role="article"]')) {
+            const text = (selector) => {
+                const el = card.querySelector(selector);
+                return el ? (el.textContent || '').trim() : '';
+            };
+            const link = card.querySelector('a.hfpxzc, a[href*="/maps/place/"]');
+            const website = card.querySelector('a[data-value="Website"]');
+            
+            // The first detail line reads "Category · Address"
+            let category = '', address = '';
+            const line = card.querySelector('.W4Efsd .W4Efsd');
+            if (line) {
+                const parts = line.textContent.split('·').map(part => part.trim()).filter(Boolean);
+                category = parts[0] || '';
+                address = parts.length > 1 ? parts[parts.length - 1] : '';
+            }
+            
+            const rating = NUM_RE.exec(text('.MW4etd'));
+            cards.push({
+                name: text('.qBF1Pd') || (link && link.getAttribute('aria-label')) || '',
+                address,
+                phone: text('.UsdlK'),
+                website: website ? website.getAttribute('href') || '' : '',
+                rating: rating ? rating[0] : '',
+                reviews: text('.UY7F9').replace(NON_DIGIT_RE, ''),
+                category,
+                href: link ? link.getAttribute('href') || '' : ''
+            });
+        }
+        return cards;
+    };
+"""
+
+_RATING_RE = re.compile(r'([0-9]\.[0-9])')
+_REVIEWS_RE = re.compile(r'([0-9,]+)')
+
+
+def _digit_count(text: str) -> int:
+    """Count ASCII digits with C-level str.count scans"""
+    return sum(map(text.count, '0123456789'))
+
+
+def _first_match(candidates, extract):
+    """Return the first non-empty value extract() yields, with the selector that matched it"""
+    for candidate in candidates:
+        value = extract(candidate)
+        if value:
+            return value, candidate['selector']
+    return '', None
+
+
+def _place_token(element_info) -> str:
+    """Lower-case part of a listing's place id, as it appears in the Maps URL
+    
+    Place links carry the full "0x...:0x..." id; a bare data-cid is the
+    decimal form of its second half.
+    """
+    match = _PLACE_ID_RE.search(element_info.get('href') or '')
+    if match:
+        return match.group(1).lower()
+    cid = element_info.get('cid')
+    if cid and cid.isdigit():
+        return f":0x{int(cid):x}"
+    return ''
+
+
+def _candidate_text(candidate) -> str:
+    """Stripped text content of a candidate"""
+    return candidate['text'].strip()
+
+
+def _candidate_phone(candidate) -> str:
+    """First phone-looking run with at least 7 digits in a candidate's text, tel: link or label"""
+    href = candidate['href']
+    phone_text = (candidate['text'].strip()
+                  or (href[4:].strip() if href.startswith('tel:') else '')
+                  or candidate['aria'].strip())
+    for match in _PHONE_RE.finditer(phone_text):
+        found_phone = match.group(0).strip()
+        if _digit_count(found_phone) >= 7:  # Minimum 7 digits for a valid phone
+            return found_phone
+    return ''
+
+
+def _candidate_website(candidate) -> str:
+    """A candidate's link; the website selectors already exclude Google Maps links"""
+    return candidate['href']
+
+
+def _candidate_rating(candidate) -> str:
+    """Rating value from a candidate's text or label"""
+    match = _RATING_RE.search(candidate['text'] or candidate['aria'])
+    return match.group(1) if match else ''
+
+
+def _candidate_reviews(candidate) -> str:
+    """Review count from a candidate's text or label, without separators"""
+    match = _REVIEWS_RE.search(candidate['text'] or candidate['aria'])
+    return match.group(1).replace(',', '') if match else ''
+
 
 class GoogleMapsScraper:
     """Google Maps scraper using Playwright for browser automation"""
     
-    def __init__(self, scraping_thread=None):
+    # Businesses are delivered to business_callback in batches; a batch is
+    # flushed once it is this large or this many seconds have passed
+    BUSINESS_BATCH_SIZE = 50
+    BUSINESS_BATCH_INTERVAL = 0.5
+    
+    # Resource types the scraper never reads; aborted at the request level.
+    # Stylesheets are opt-in because visibility checks depend on layout.
+    BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+    BLOCK_STYLESHEETS = False
+    # Analytics and ad hosts aborted whatever the resource type
+    BLOCKED_URL_PARTS = ('doubleclick.net', 'google-analytics.com', 'googletagmanager.com')
+    
+    # Longest wait in milliseconds for Maps to inject new results after each scroll
+    SCROLL_SETTLE_MS = 300
+    # Upper bound in seconds on the scroll phase of a single search
+    SCROLL_TIME_LIMIT = 20
+    # Consecutive scrolls without new listings after which the list is exhausted
+    SCROLL_PLATEAU_TICKS = 3
+    
+    # Matches returned per details field; with selectors ordered by hit rate
+    # the first one nearly always wins, so the long fallback tails are skipped
+    FIELD_CANDIDATE_LIMIT = 3
+    # Businesses extracted between reorderings of the field selectors
+    FIELD_REORDER_INTERVAL = 50
+    
+    # Milliseconds a listing click may wait for its target before falling back
+    CLICK_TIMEOUT_MS = 5000
+    
+    # Detail tabs per keyword that place pages are fetched in concurrently
+    DETAIL_PAGE_CONCURRENCY = 3
+    
+    # The app's config directory; kept owner-only since it holds session cookies
+    APP_DIR = Path.home() / '.solo_scrapper'
+    # Reused across runs so Chrome's cache, cookies and TLS sessions stay warm
+    PROFILE_DIR = APP_DIR / 'browser_profile'
+    # Cookies and local storage of a clean context, carried over to the next run
+    STORAGE_STATE_PATH = APP_DIR / 'browser_state.json'
+    
+    # Page size for every tab; nothing reads pixels, so keep compositing cheap
+    VIEWPORT = {'width': 1024, 'height': 768}
+    
+    def __init__(self, scraping_thread=None, headless=True, debug=False):
+        self.headless = headless  # Headed mode is opt-in for debugging
+        self.debug = debug  # Per-click diagnostics cost extra round-trips
+        self.playwright = None
         self.browser = None
         self.browser_context = None
-        self.page = None
         self.scraping_thread = scraping_thread
-        self.temp_profile = None
+        # Listing selector -> number of searches it matched, for probe ordering
+        self._selector_hits = Counter()
+        # Same for the details-panel field selectors, reordered periodically
+        self._field_hits = {field: Counter() for field in _FIELD_SELECTORS}
+        self._field_selectors = _FIELD_SELECTORS
+        self._extraction_count = 0
+    
+    @classmethod
+    def _shared_profile_dir(cls):
+        """Return the reusable profile directory, or None if a live browser is using it"""
+        cls._make_private_dir(cls.APP_DIR)
+        profile_dir = str(cls._make_private_dir(cls.PROFILE_DIR))
+        
+        lock_path = os.path.join(profile_dir, 'SingletonLock')
+        if os.path.lexists(lock_path):
+            if cls._lock_owner_alive(lock_path):
+                return None
+            # Left behind by a browser that crashed; Chrome would refuse the profile
+            os.unlink(lock_path)
+        return profile_dir
+    
+    @staticmethod
+    def _make_private_dir(path):
+        """Create a directory readable only by its owner, tightening an existing one"""
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        # makedirs leaves an existing directory's mode alone
+        os.chmod(path, 0o700)
+        return path
+    
+    @staticmethod
+    def _lock_owner_alive(lock_path):
+        """Whether the Chrome process named by a SingletonLock link is still running"""
+        try:
+            # Chrome points the link at "<hostname>-<pid>"
+            hostname, _, pid = os.readlink(lock_path).rpartition('-')
+            pid = int(pid)
+        except (OSError, ValueError):
+            return True  # Unreadable lock, so assume it is held
+        if hostname != socket.gethostname():
+            return True  # Another machine on a shared home directory
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            return True  # Exists but belongs to someone else
+        return True
     
     async def setup_browser(self, chrome_path=None, profile_path=None, progress_callback=None):
         """Setup browser with optional Chrome path and profile"""
@@ -42,31 +694,12 @@ class GoogleMapsScraper:
                 progress_callback.emit("🚀 Starting browser...")
             
             playwright = await async_playwright().start()
+            self.playwright = playwright
             
             # Browser launch options
             launch_options = {
-                'headless': False,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-extensions-except',
-                    '--disable-extensions',
-                    '--no-first-run',
-                    '--disable-default-apps',
-                    '--disable-features=TranslateUI',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-field-trial-config',
-                    '--disable-back-forward-cache',
-                    '--disable-hang-monitor',
-                    '--disable-prompt-on-repost',
-                    '--disable-sync',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--window-size=1920,1080'
-                ]
+                'headless': self.headless,
+                'args': [*_CHROME_ARGS, f"--window-size={self.VIEWPORT['width']},{self.VIEWPORT['height']}"]
             }
             
             # Add Chrome executable path if provided
@@ -75,19 +708,18 @@ class GoogleMapsScraper:
                 if progress_callback:
                     progress_callback.emit(f"🔧 Using Chrome: {chrome_path}")
             
-            # Use a temporary profile directory to avoid conflicts
+            # Use the shared warm profile when a profile is configured and no
+            # other browser holds its SingletonLock
+            shared_profile = None
             if profile_path and os.path.exists(profile_path):
+                shared_profile = self._shared_profile_dir()
                 if progress_callback:
-                    progress_callback.emit(f"👤 Creating temporary profile based on: {profile_path}")
-                
-                # Create a temporary profile directory to avoid SingletonLock issues
-                import tempfile
-                import shutil
-                temp_profile = tempfile.mkdtemp(prefix="chrome_profile_")
-                
-                # Copy essential profile data if needed (optional)
-                # For now, use clean temporary profile to avoid conflicts
-                
+                    if shared_profile:
+                        progress_callback.emit(f"👤 Using warm shared profile for: {profile_path}")
+                    else:
+                        progress_callback.emit("👤 Shared profile in use, starting with a clean browser context")
+            
+            if shared_profile:
                 # Remove web security disable flag that requires non-default user-data-dir
                 safe_launch_options = launch_options.copy()
                 safe_launch_options['args'] = [arg for arg in launch_options['args'] if not arg.startswith('--disable-web-security')]
@@ -98,27 +730,15 @@ class GoogleMapsScraper:
                     del safe_launch_options['executable_path']
                 
                 self.browser_context = await playwright.chromium.launch_persistent_context(
-                    user_data_dir=temp_profile,
-                    viewport={'width': 1920, 'height': 1080},
+                    user_data_dir=shared_profile,
+                    viewport=self.VIEWPORT,
                     **safe_launch_options
                 )
                 self.browser = None  # Not needed with persistent context
-                self.temp_profile = temp_profile  # Store for cleanup
+                await self._prepare_context(self.browser_context)
             else:
                 self.browser = await playwright.chromium.launch(**launch_options)
-                self.browser_context = await self.browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            self.page = await self.browser_context.new_page()
-            
-            # Set additional page properties to avoid detection
-            await self.page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-            """)
+                self.browser_context = await self.open_context()
             
             if progress_callback:
                 progress_callback.emit("✅ Browser setup complete")
@@ -130,26 +750,75 @@ class GoogleMapsScraper:
                 progress_callback.emit(f"❌ Browser setup failed: {str(e)}")
             return False
     
-    async def search_keyword(self, keyword: str, progress_callback=None, business_callback=None) -> List[Dict[str, str]]:
-        """Search for businesses using a keyword on Google Maps"""
+    async def open_context(self):
+        """Open a fresh context on the running browser, restoring the last saved session"""
+        storage_state = self.STORAGE_STATE_PATH if self.STORAGE_STATE_PATH.exists() else None
+        try:
+            context = await self.browser.new_context(
+                viewport=self.VIEWPORT,
+                user_agent=_USER_AGENT,
+                storage_state=storage_state
+            )
+        except Exception as e:
+            if storage_state is None:
+                raise
+            # A corrupt or incompatible snapshot only costs the warm session
+            print(f"Error restoring browser state: {e}")
+            context = await self.browser.new_context(
+                viewport=self.VIEWPORT,
+                user_agent=_USER_AGENT
+            )
+        await self._prepare_context(context)
+        return context
+    
+    async def _prepare_context(self, context):
+        """Apply request blocking, page helpers and the webdriver override to every page of a context"""
+        # Skip downloading tiles, images, fonts and analytics on every page
+        await context.route("**/*", self._route_resource)
+        
+        await context.add_init_script(_PAGE_HELPERS_JS)
+        
+        # Set additional page properties to avoid detection on every page
+        await context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+        """)
+    
+    async def _route_resource(self, route):
+        """Abort requests for resource types and trackers the scraper does not need"""
+        request = route.request
+        resource_type = request.resource_type
+        if (resource_type in self.BLOCKED_RESOURCE_TYPES
+                or (self.BLOCK_STYLESHEETS and resource_type == 'stylesheet')
+                or any(part in request.url for part in self.BLOCKED_URL_PARTS)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def search_keyword(self, keyword: str, page: Page, progress_callback=None, business_callback=None) -> List[Business]:
+        """Search for businesses using a keyword on Google Maps in the given page"""
         try:
             if progress_callback:
                 progress_callback.emit(f"🔍 Searching for: {keyword}")
             
+            # Encode once so characters like & and / survive in both URL forms
+            encoded_keyword = quote_plus(keyword)
+            
             # Navigate to Google Maps with retry mechanism
             navigation_success = False
             for attempt in range(2):
                 try:
                     if attempt == 0:
-                        maps_url = f"https://www.google.com/maps/search/{keyword.replace(' ', '+')}"
+                        maps_url = f"https://www.google.com/maps/search/{encoded_keyword}"
                     else:
                         # Fallback URL format
-                        maps_url = f"https://maps.google.com/maps?q={keyword.replace(' ', '+')}"
+                        maps_url = f"https://maps.google.com/maps?q={encoded_keyword}"
                     
                     if progress_callback:
                         progress_callback.emit(f"🌐 Navigating to: {maps_url} (attempt {attempt + 1})")
                     
-                    await self.page.goto(maps_url, wait_until='domcontentloaded', timeout=30000)
+                    await page.goto(maps_url, wait_until='domcontentloaded', timeout=15000)
                     navigation_success = True
                     break
                     
@@ -165,42 +834,28 @@ class GoogleMapsScraper:
                 raise Exception("Failed to navigate to Google Maps after multiple attempts")
             
             if progress_callback:
-                progress_callback.emit("✅ Page loaded, waiting for content to stabilize...")
-            
-            await asyncio.sleep(1)  # Reduced wait time for dynamic content
-            
-            if progress_callback:
-                progress_callback.emit("⏳ Waiting for results to load...")
+                progress_callback.emit("⏳ Page loaded, waiting for results to load...")
             
             # Wait for results to load with multiple selectors
-            selectors_to_try = [
-                '[role="main"]',
-                '.m6QErb',
-                '[data-result-index]',
-                'div[role="article"]',
-                '.Nv2PK',  # Additional Google Maps selectors
-                '.bJzME',
-                '.lI9IFe'
-            ]
+            selectors_to_try = _RESULT_SELECTORS
             
             if progress_callback:
-                progress_callback.emit(f"🔍 Trying {len(selectors_to_try)} different selectors to detect results...")
+                progress_callback.emit(f"🔍 Waiting on {len(selectors_to_try)} different selectors to detect results...")
             
+            # A single in-page predicate races all candidates; attachment is enough here
             results_found = False
-            for i, selector in enumerate(selectors_to_try):
-                try:
-                    if progress_callback:
-                        progress_callback.emit(f"🔍 Attempting selector {i+1}/{len(selectors_to_try)}: {selector}")
-                    
-                    await self.page.wait_for_selector(selector, timeout=8000)
-                    results_found = True
-                    if progress_callback:
-                        progress_callback.emit(f"✅ Found results with selector: {selector}")
-                    break
-                except Exception as selector_error:
-                    if progress_callback:
-                        progress_callback.emit(f"❌ Selector {selector} failed: {str(selector_error)[:50]}...")
-                    continue
+            try:
+                await page.wait_for_function(
+                    "(selectors) => selectors.some(selector => document.querySelector(selector))",
+                    arg=selectors_to_try,
+                    timeout=8000
+                )
+                results_found = True
+                if progress_callback:
+                    progress_callback.emit("✅ Found results")
+            except Exception as selector_error:
+                if progress_callback:
+                    progress_callback.emit(f"❌ Results selectors failed: {str(selector_error)[:50]}...")
             
             if not results_found:
                 if progress_callback:
@@ -209,17 +864,14 @@ class GoogleMapsScraper:
                 return []
             
             # Check if paused before scrolling
-            if self.scraping_thread:
-                while self.scraping_thread.is_paused:
-                    await asyncio.sleep(0.1)
-                if not self.scraping_thread.is_running:
-                    return []
+            if self.scraping_thread and not await self.scraping_thread.wait_while_paused():
+                return []
             
             # Scroll to load all results
-            await self._scroll_results_panel(progress_callback)
+            await self._scroll_results_panel(page, progress_callback)
             
             # Extract business listings with real-time callback
-            businesses = await self._extract_business_listings_fast(keyword, progress_callback, business_callback)
+            businesses = await self._extract_business_listings_fast(page, keyword, progress_callback, business_callback)
             
             if progress_callback:
                 progress_callback.emit(f"🎯 Extracted {len(businesses)} businesses for '{keyword}'")
@@ -237,7 +889,7 @@ class GoogleMapsScraper:
                     progress_callback.emit(f"❌ Error searching {keyword}: {error_msg}")
             return []
     
-    async def _scroll_results_panel(self, progress_callback=None):
+    async def _scroll_results_panel(self, page: Page, progress_callback=None):
         """Scroll the results panel to load all businesses"""
         try:
             if progress_callback:
@@ -247,97 +899,19 @@ class GoogleMapsScraper:
             scroll_attempts = 0
             max_scrolls = 25  # Increased from 15
             no_change_count = 0
+            scroll_started = time.monotonic()
             
             while scroll_attempts < max_scrolls:
-                # Scroll down in the results panel more aggressively with multiple selectors
-                await self.page.evaluate("""
-                    () => {
-                        // Try multiple selectors for the scrollable results panel
-                        const selectors = [
-                            '[role="main"]',
-                            '.m6QErb',
-                            '[data-value="Search results"]',
-                            '.Nv2PK',
-                            '.bJzME',
-                            '.lI9IFe',
-                            '[aria-label*="Results for"]',
-                            '.section-scrollbox',
-                            '.section-layout'
-                        ];
-                        
-                        let scrolled = false;
-                        for (const selector of selectors) {
-                            const panel = document.querySelector(selector);
-                            if (panel && panel.scrollHeight > panel.clientHeight) {
-                                panel.scrollTop += 2000;  // Aggressive scroll
-                                scrolled = true;
-                                console.log(`Scrolled using selector: ${selector}`);
-                                break;
-                            }
-                        }
-                        
-                        // Also try scrolling the entire page as fallback
-                        window.scrollBy(0, 1000);
-                        
-                        // Try to click "Show more" or "Load more" buttons if they exist
-                        const moreButtons = [
-                            'button[aria-label*="more"]',
-                            'button[aria-label*="More"]',
-                            '.VfPpkd-LgbsSe[aria-label*="more"]',
-                            '[data-value="Show more results"]'
-                        ];
-                        
-                        for (const buttonSelector of moreButtons) {
-                            const button = document.querySelector(buttonSelector);
-                            if (button && button.offsetParent !== null) {
-                                button.click();
-                                console.log(`Clicked more button: ${buttonSelector}`);
-                                break;
-                            }
-                        }
-                        
-                        return scrolled;
-                    }
-                """)
-                
-                await asyncio.sleep(random.uniform(0.3, 0.8))  # Optimized wait for content to load
+                # Scroll, wait for content and count listings in a single round-trip
+                scroll_state = await page.evaluate(
+                    "([delayMs, previousCount]) => window.__smScrollAndCount(delayMs, previousCount)",
+                    [self.SCROLL_SETTLE_MS, last_business_count]
+                )
+                current_business_count = scroll_state['count']
                 
                 # Check if paused during scrolling
-                if self.scraping_thread:
-                    while self.scraping_thread.is_paused:
-                        await asyncio.sleep(0.1)
-                    if not self.scraping_thread.is_running:
-                        return
-                
-                # Count current business listings with improved detection
-                current_business_count = await self.page.evaluate("""
-                    () => {
-                        const selectors = [
-                            'div[role="article"]',
-                            '.m6QErb',
-                            '[data-result-index]',
-                            '.Nv2PK',
-                            '.bJzME',
-                            '.lI9IFe',
-                            'a[data-cid]',
-                            '[jsaction*="pane.resultCard"]',
-                            '.section-result'
-                        ];
-                        
-                        let maxCount = 0;
-                        let bestSelector = '';
-                        for (const selector of selectors) {
-                            const elements = document.querySelectorAll(selector);
-                            if (elements.length > maxCount) {
-                                maxCount = elements.length;
-                                bestSelector = selector;
-                            }
-                        }
-                        
-                        console.log(`Best selector: ${bestSelector} found ${maxCount} businesses`);
-                        return maxCount;
-                    }
-                """)
+                if self.scraping_thread and not await self.scraping_thread.wait_while_paused():
+                    return
                 
                 if progress_callback:
                     progress_callback.emit(f"📜 Scrolling... ({scroll_attempts+1}/{max_scrolls}) - Found {current_business_count} businesses")
@@ -349,12 +923,22 @@ class GoogleMapsScraper:
                 else:
                     no_change_count += 1
                     
-                # Stop if no new businesses found for 3 consecutive attempts
-                if no_change_count >= 3:
+                # Stop once the count has plateaued
+                if no_change_count >= self.SCROLL_PLATEAU_TICKS:
                     if progress_callback:
                         progress_callback.emit(f"📜 Scrolling complete - No new businesses found after {no_change_count} attempts")
                     break
                     
+                if scroll_state['reachedEnd']:
+                    if progress_callback:
+                        progress_callback.emit("📜 Scrolling complete - Reached the end of the list")
+                    break
+                    
+                if time.monotonic() - scroll_started > self.SCROLL_TIME_LIMIT:
+                    if progress_callback:
+                        progress_callback.emit(f"📜 Scrolling stopped after {self.SCROLL_TIME_LIMIT}s")
+                    break
+                    
                 scroll_attempts += 1
                 
             if progress_callback:
@@ -364,54 +948,108 @@ class GoogleMapsScraper:
             if progress_callback:
                 progress_callback.emit(f"❌ Error during scrolling: {str(e)}")
     
-    async def _extract_business_listings_fast(self, keyword: str, progress_callback=None, business_callback=None) -> List[Dict[str, str]]:
+    async def _extract_business_listings_fast(self, page: Page, keyword: str, progress_callback=None, business_callback=None) -> List[Business]:
         """Extract business information using resilient multi-strategy approach"""
         businesses = []
+        pending_batch = []
+        last_flush = time.monotonic()
+        
+        def deliver(business):
+            """Record a business and hand it to business_callback in batches"""
+            nonlocal pending_batch, last_flush
+            businesses.append(business)
+            if business_callback:
+                pending_batch.append(business)
+                if (len(pending_batch) >= self.BUSINESS_BATCH_SIZE
+                        or time.monotonic() - last_flush >= self.BUSINESS_BATCH_INTERVAL):
+                    business_callback.emit(pending_batch)
+                    pending_batch = []
+                    last_flush = time.monotonic()
         
         try:
             if progress_callback:
                 progress_callback.emit("🔍 Using resilient extraction with click-through method...")
             
-            # Wait for content to be fully loaded
-            await asyncio.sleep(3)
+            # Wait until listings are in the DOM rather than for a fixed time
+            try:
+                await page.wait_for_selector(', '.join(_LISTING_SELECTORS), state='attached', timeout=3000)
+            except Exception:
+                pass
+            
+            # Listings whose result card already shows every field are read in
+            # one in-page pass; only the rest need a click-through
+            complete_hrefs = set()
+            for card in await self._extract_listing_cards(page):
+                if card['href'] and card['name'] and card['address'] and card['phone'] and card['website']:
+                    deliver(self._make_business(card, keyword))
+                    complete_hrefs.add(card['href'])
+            
+            if complete_hrefs and progress_callback:
+                progress_callback.emit(f"⚡ Took {len(complete_hrefs)} complete listings straight from the result cards")
             
             # Get all business listing elements using multiple strategies
-            business_elements = await self._get_business_elements()
+            business_elements = [
+                element_info for element_info in await self._get_business_elements(page)
+                if element_info['href'] not in complete_hrefs
+            ]
             
             if not business_elements:
-                if progress_callback:
+                if not businesses and progress_callback:
                     progress_callback.emit("❌ No business elements found")
-                return []
+                return businesses
             
             if progress_callback:
                 progress_callback.emit(f"📊 Found {len(business_elements)} business listings to process")
             
-            # Process each business by clicking and extracting detailed info
+            # Listings that link to a place page are fetched concurrently in
+            # their own tabs; the rest fall back to clicking through the list
+            place_elements = [e for e in business_elements if '/maps/place/' in e['href']]
+            business_elements = [e for e in business_elements if '/maps/place/' not in e['href']]
+            
+            if place_elements:
+                if progress_callback:
+                    progress_callback.emit(f"🚀 Fetching {len(place_elements)} place pages in parallel...")
+                
+                # A few dedicated detail tabs are reused for every place, so the
+                # list page keeps its scroll state and no tab is opened per listing
+                detail_pages = asyncio.Queue()
+                for _ in range(min(self.DETAIL_PAGE_CONCURRENCY, len(place_elements))):
+                    detail_pages.put_nowait(None)
+                tasks = [
+                    asyncio.ensure_future(self._fetch_place_details(e['href'], keyword, detail_pages, progress_callback))
+                    for e in place_elements
+                ]
+                try:
+                    for future in asyncio.as_completed(tasks):
+                        business_data = await future
+                        if business_data and business_data.name:
+                            deliver(business_data)
+                            if progress_callback:
+                                progress_callback.emit(f"✅ Extracted: {business_data.name}")
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    # Let cancelled fetches hand their tabs back before closing them
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    await self._close_detail_pages(detail_pages)
+            
+            # Process each remaining business by clicking and extracting detailed info
             for i, element_info in enumerate(business_elements):  # Process all businesses found
                 # Check if paused before processing each business
-                if self.scraping_thread:
-                    while self.scraping_thread.is_paused:
-                        await asyncio.sleep(0.1)
-                    if not self.scraping_thread.is_running:
-                        return businesses
+                if self.scraping_thread and not await self.scraping_thread.wait_while_paused():
+                    return businesses
                 
                 if progress_callback:
                     progress_callback.emit(f"🔄 Processing business {i+1}/{len(business_elements)}")
                 
                 try:
-                    business_data = await self._extract_single_business(element_info, keyword, progress_callback)
+                    business_data = await self._extract_single_business(page, element_info, keyword, progress_callback)
                     
-                    if business_data and business_data.get('name'):
-                        businesses.append(business_data)
-                        
-                        if business_callback:
-                            business_callback.emit(business_data)
+                    if business_data and business_data.name:
+                        deliver(business_data)
                         
                         if progress_callback:
-                            progress_callback.emit(f"✅ Extracted: {business_data.get('name', 'Unknown')}")
-                    
-                    # Minimal delay between extractions for speed
-                    await asyncio.sleep(0.1)
+                            progress_callback.emit(f"✅ Extracted: {business_data.name}")
                     
                 except Exception as e:
                     if progress_callback:
@@ -421,100 +1059,117 @@ class GoogleMapsScraper:
         except Exception as e:
             if progress_callback:
                 progress_callback.emit(f"❌ Error in extraction process: {str(e)}")
+        finally:
+            # Deliver whatever is left, including on early stop
+            if business_callback and pending_batch:
+                business_callback.emit(pending_batch)
         
         return businesses
     
-    async def _get_business_elements(self):
+    async def _extract_listing_cards(self, page: Page) -> List[Dict[str, str]]:
+        """Read the fields shown on every result card in a single evaluate"""
+        try:
+            return await page.evaluate("() => window.__smListingCards()")
+        except Exception as e:
+            print(f"⚠ Result card extraction failed: {e}")
+            return []
+    
+    @staticmethod
+    def _make_business(fields: Dict[str, str], keyword: str) -> Business:
+        """Build a Business record from extracted fields"""
+        name = fields.get('name', '')
+        address = fields.get('address', '')
+        return Business(
+            keyword=keyword,
+            name=name,
+            address=address,
+            phone=fields.get('phone', ''),
+            website=fields.get('website', ''),
+            rating=fields.get('rating', ''),
+            reviews=fields.get('reviews', ''),
+            category=fields.get('category', ''),
+            # Dedup key is normalized once here instead of by every consumer
+            key=business_fingerprint(name.strip().casefold(), address.strip().casefold())
+        )
+    
+    async def _get_business_elements(self, page: Page):
         """Get business elements using Playwright's native element detection"""
-        print("\n=== Starting business element detection ===")
+        logger.debug("Starting business element detection")
         try:
             # Wait for results to load
-            print("Waiting for main content to load...")
-            await self.page.wait_for_selector('[role="main"]', timeout=10000)
-            print("✓ Main content loaded successfully")
-            
-            # Multiple selectors for business listings - prioritized by reliability
-            selectors = [
-                'a[data-cid]',  # Most reliable - has business ID
-                '.hfpxzc',  # Common business link class
-                'a[href*="/maps/place/"]',  # Direct place links
-                'div[role="article"] a',  # Article containers with links
-                'div[jsaction*="selectResult"]',  # Elements with select action
-                '[data-result-index] a',  # Indexed results
-                'div[role="article"]'  # Fallback to article containers
-            ]
+            await page.wait_for_selector('[role="main"]', timeout=10000)
+            
+            # Multiple selectors for business listings - the ones that matched most
+            # often this session first, ties keep the reliability order
+            selectors = sorted(_LISTING_SELECTORS, key=lambda selector: -self._selector_hits[selector])
             
             business_elements = []
-            print(f"Trying {len(selectors)} different selectors...")
             
             for idx, selector in enumerate(selectors, 1):
-                print(f"\n[{idx}/{len(selectors)}] Trying selector: '{selector}'")
+                logger.debug("[%d/%d] Trying selector %r", idx, len(selectors), selector)
                 try:
-                    # Use Playwright's native element detection
-                    elements = await self.page.query_selector_all(selector)
+                    # Text, href, data-cid and visibility for every match
+                    # come back in a single round-trip
+                    elements = await page.eval_on_selector_all(selector, 'els => window.__smListingInfo(els)')
                     
                     if elements:
-                        print(f"  ✓ Found {len(elements)} elements")
                         visible_count = 0
                         processed_count = 0
+                        # Maps can render one listing in several containers
+                        seen_keys = set()
                         
-                        for i, element in enumerate(elements):  # Process all elements
-                            try:
-                                processed_count += 1
-                                # Check if element is visible
-                                is_visible = await element.is_visible()
+                        for i, data in enumerate(elements):  # Process all elements
+                            processed_count += 1
+                            if data['visible']:
+                                visible_count += 1
+                                listing_key = data['cid'] or data['href']
+                                if listing_key:
+                                    if listing_key in seen_keys:
+                                        continue
+                                    seen_keys.add(listing_key)
+                                
+                                element_info = {
+                                    # Resolved lazily, so a click always targets the live node
+                                    'element': page.locator(selector).nth(i),
+                                    'selector': selector,
+                                    'index': i,
+                                    'text': data['text'],
+                                    'href': data['href'],
+                                    'has_data_cid': bool(data['cid']),
+                                    'cid': data['cid']
+                                }
                                 
-                                if is_visible:
-                                    visible_count += 1
-                                    # Get element text for identification
-                                    text_content = await element.text_content()
-                                    href = await element.get_attribute('href')
-                                    data_cid = await element.get_attribute('data-cid')
-                                    
-                                    element_info = {
-                                        'element': element,
-                                        'selector': selector,
-                                        'index': i,
-                                        'text': (text_content or '').strip()[:100],
-                                        'href': href or '',
-                                        'has_data_cid': bool(data_cid)
-                                    }
-                                    
-                                    business_elements.append(element_info)
-                                    
-                                    # Log first few elements for debugging
-                                    if len(business_elements) <= 3:
-                                        print(f"    [{len(business_elements)}] Text: '{element_info['text'][:50]}{'...' if len(element_info['text']) > 50 else ''}'")
-                                        print(f"        Has data-cid: {element_info['has_data_cid']}, Has href: {bool(element_info['href'])}")
-                                        
-                            except Exception as e:
-                                print(f"    ⚠ Error processing element {i}: {e}")
-                                continue
+                                business_elements.append(element_info)
                         
-                        print(f"  → Processed {processed_count} elements, {visible_count} visible, {len(business_elements)} valid")
+                        logger.debug("  %d elements, %d visible, %d valid",
+                                     processed_count, visible_count, len(business_elements))
                         
                         if business_elements:
-                            print(f"  ✓ Successfully found {len(business_elements)} business elements with selector '{selector}'")
+                            self._selector_hits[selector] += 1
                             break  # Use first successful strategy
                     else:
-                        print(f"  ✗ No elements found")
+                        logger.debug("  No elements found")
                             
                 except Exception as e:
-                    print(f"  ✗ Error with selector '{selector}': {e}")
+                    logger.debug("  Error with selector %r: %s", selector, e)
                     continue
             
-            print(f"\n=== Element detection complete: {len(business_elements)} businesses found ===")
+            logger.debug("Element detection complete: %d businesses found", len(business_elements))
             return business_elements
             
         except Exception as e:
             print(f"✗ Critical error getting business elements: {e}")
             return []
     
-    async def _extract_single_business(self, element_info, keyword, progress_callback=None):
+    async def _extract_single_business(self, page: Page, element_info, keyword, progress_callback=None):
         """Extract detailed information for a single business by clicking on it"""
         try:
+            # Remember which business the panel shows, so the wait below does
+            # not mistake it for the one being clicked
+            await page.evaluate("() => window.__smMarkPanel()")
+            
             # Click on the business element
-            click_success = await self._click_business_element(element_info)
+            click_success = await self._click_business_element(page, element_info)
             
             if not click_success:
                 if progress_callback:
@@ -522,25 +1177,25 @@ class GoogleMapsScraper:
                 return None
             
             # Wait for details panel to load with better detection
-            await self._wait_for_business_panel(progress_callback)
+            await self._wait_for_business_panel(page, progress_callback, _place_token(element_info))
             
             # Extract detailed information from the side panel using Playwright methods
             if progress_callback:
                 progress_callback.emit("🔍 Extracting business data...")
             
-            business_data = await self._extract_business_data_native()
+            business_data = await self._extract_business_data_native(page)
             
             if progress_callback:
                 progress_callback.emit(f"📊 Raw extracted data: {business_data}")
             
             # Add keyword to the data
             if business_data:
-                business_data['keyword'] = keyword
+                business = self._make_business(business_data, keyword)
                 
                 if progress_callback:
-                    progress_callback.emit(f"✅ Successfully extracted: {business_data.get('name', 'Unknown')}")
+                    progress_callback.emit(f"✅ Successfully extracted: {business.name or 'Unknown'}")
                     
-                return business_data
+                return business
             else:
                 if progress_callback:
                     progress_callback.emit("⚠️ No business data extracted")
@@ -551,81 +1206,82 @@ class GoogleMapsScraper:
                 progress_callback.emit(f"⚠️ Error extracting business details: {str(e)}")
             return None
     
-    async def _click_business_element(self, element_info):
+    async def _fetch_place_details(self, href: str, keyword: str, detail_pages, progress_callback=None) -> Optional[Business]:
+        """Load a listing's place page in a borrowed detail tab and extract its details"""
+        detail_page = await detail_pages.get()
+        try:
+            # Check if paused or stopped before loading another place
+            if self.scraping_thread and not await self.scraping_thread.wait_while_paused():
+                return None
+            
+            # Detail tabs are opened on first use and replaced if they crashed
+            if detail_page is None or detail_page.is_closed():
+                detail_page = await self.browser_context.new_page()
+            
+            await detail_page.goto(urljoin('https://www.google.com', href), wait_until='domcontentloaded', timeout=15000)
+            await self._wait_for_business_panel(detail_page)
+            business_data = await self._extract_business_data_native(detail_page)
+            return self._make_business(business_data, keyword) if business_data else None
+        except Exception as e:
+            if progress_callback:
+                progress_callback.emit(f"⚠️ Error fetching place page: {str(e)}")
+            return None
+        finally:
+            detail_pages.put_nowait(detail_page)
+    
+    @staticmethod
+    async def _close_detail_pages(detail_pages):
+        """Close every detail tab that was opened for a search"""
+        while not detail_pages.empty():
+            detail_page = detail_pages.get_nowait()
+            try:
+                if detail_page is not None and not detail_page.is_closed():
+                    await detail_page.close()
+            except Exception as e:
+                print(f"Error closing detail page: {e}")
+    
+    async def _click_business_element(self, page: Page, element_info):
         """Click on a business element using Playwright's native click"""
-        business_text = element_info.get('text', 'Unknown')[:50]
-        print(f"\n🖱️  Attempting to click business: '{business_text}'")
-        print(f"   Selector: {element_info.get('selector', 'N/A')}")
-        print(f"   Index: {element_info.get('index', 'N/A')}")
-        print(f"   Has data-cid: {element_info.get('has_data_cid', False)}")
+        if self.debug:
+            business_text = element_info.get('text', 'Unknown')[:50]
+            print(f"\n🖱️  Attempting to click business: '{business_text}'")
+            print(f"   Selector: {element_info.get('selector', 'N/A')}")
+            print(f"   Index: {element_info.get('index', 'N/A')}")
+            print(f"   Has data-cid: {element_info.get('has_data_cid', False)}")
         
         try:
             element = element_info['element']
             
-            # Check if element is still attached to DOM
-            try:
-                is_attached = await element.evaluate('el => el.isConnected')
-                if not is_attached:
-                    print(f"   ✗ Element is no longer attached to DOM")
-                    return False
-            except Exception as attach_error:
-                print(f"   ⚠ Could not check element attachment: {attach_error}")
-            
-            # Ensure element is still visible
-            is_visible = await element.is_visible()
-            print(f"   Visibility check: {'✓ Visible' if is_visible else '✗ Not visible'}")
+            if self.debug:
+                await self._log_click_target(element)
             
-            if is_visible:
-                # Get element position for debugging
-                try:
-                    bbox = await element.bounding_box()
-                    if bbox:
-                        print(f"   Position: x={bbox['x']:.1f}, y={bbox['y']:.1f}, w={bbox['width']:.1f}, h={bbox['height']:.1f}")
-                    else:
-                        print(f"   ⚠ Could not get element bounding box")
-                except Exception as bbox_error:
-                    print(f"   ⚠ Error getting bounding box: {bbox_error}")
-                
-                # Scroll element into view if needed
-                print(f"   📜 Scrolling element into view...")
-                await element.scroll_into_view_if_needed()
-                
-                # Wait a moment for any animations
-                await asyncio.sleep(0.5)
-                
-                # Use Playwright's native click with force option
-                print(f"   🎯 Executing click...")
-                await element.click(force=True)
-                
+            # Scroll into view, then use Playwright's native click with force option
+            await element.scroll_into_view_if_needed(timeout=self.CLICK_TIMEOUT_MS)
+            await element.click(force=True, timeout=self.CLICK_TIMEOUT_MS)
+            
+            if self.debug:
                 print(f"   ✅ Click successful!")
-                return True
-            else:
-                print(f"   ✗ Element not visible, cannot click")
-                return False
+            return True
                 
         except Exception as e:
             print(f"   ✗ Primary click failed: {e}")
             
             # Fallback: try clicking by selector
-            print(f"   🔄 Attempting fallback click by selector...")
             try:
                 selector = element_info['selector']
                 index = element_info['index']
                 
-                print(f"   Fallback selector: '{selector}', index: {index}")
+                if self.debug:
+                    print(f"   🔄 Fallback selector: '{selector}', index: {index}")
                 
                 # Try to find and click the element by selector
-                elements = await self.page.query_selector_all(selector)
-                print(f"   Found {len(elements)} elements with fallback selector")
+                elements = await page.query_selector_all(selector)
                 
                 if index < len(elements):
                     fallback_element = elements[index]
-                    is_fallback_visible = await fallback_element.is_visible()
-                    print(f"   Fallback element visible: {is_fallback_visible}")
                     
-                    if is_fallback_visible:
+                    if await fallback_element.is_visible():
                         await fallback_element.scroll_into_view_if_needed()
-                        await asyncio.sleep(0.3)
                         await fallback_element.click(force=True)
                         print(f"   ✅ Fallback click successful!")
                         return True
@@ -640,10 +1296,25 @@ class GoogleMapsScraper:
             print(f"   ❌ All click attempts failed")
             return False
     
-    async def _extract_business_data_native(self):
-        """Extract business data using Playwright's native methods"""
-        print("\n📊 Starting business data extraction...")
-        
+    async def _log_click_target(self, element):
+        """Print attachment, visibility and position of a click target (debug only)"""
+        try:
+            is_attached = await element.evaluate('el => el.isConnected', timeout=self.CLICK_TIMEOUT_MS)
+            print(f"   Attached to DOM: {'✓' if is_attached else '✗'}")
+            
+            is_visible = await element.is_visible()
+            print(f"   Visibility check: {'✓ Visible' if is_visible else '✗ Not visible'}")
+            
+            bbox = await element.bounding_box(timeout=self.CLICK_TIMEOUT_MS)
+            if bbox:
+                print(f"   Position: x={bbox['x']:.1f}, y={bbox['y']:.1f}, w={bbox['width']:.1f}, h={bbox['height']:.1f}")
+            else:
+                print(f"   ⚠ Could not get element bounding box")
+        except Exception as diagnostic_error:
+            print(f"   ⚠ Could not inspect click target: {diagnostic_error}")
+    
+    async def _extract_business_data_native(self, page: Page):
+        """Extract business data from the open details panel in a single evaluate"""
         business_data = {
             'name': '',
             'address': '',
@@ -655,386 +1326,109 @@ class GoogleMapsScraper:
         }
         
         try:
-            # Extract name - multiple strategies
-            print("\n🏢 Extracting business name...")
-            name_selectors = [
-                'h1[data-attrid="title"]',
-                'h1.DUwDvf',
-                '.x3AX1-LfntMc-header-title h1',
-                '[data-attrid="title"]',
-                'h1',
-                '.qBF1Pd.fontHeadlineSmall'
-            ]
-            
-            for i, selector in enumerate(name_selectors, 1):
-                print(f"   [{i}/{len(name_selectors)}] Trying name selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        if text and text.strip():
-                            business_data['name'] = text.strip()
-                            print(f"   ✅ Found name: '{business_data['name']}'")
-                            break
-                        else:
-                            print(f"   ⚠ Element found but no text content")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
+            # The class-token fields and the first match of every field selector
+            # come back in one round-trip; only validation runs in Python
+            found = await page.evaluate(
+                "([selectorMap, maxCandidates]) => window.__smReadFields(selectorMap, maxCandidates)",
+                [self._field_selectors, self.FIELD_CANDIDATE_LIMIT]
+            )
+            business_data.update((field, value) for field, value in found['quick'].items() if value)
+            candidates = found['candidates']
             
             if not business_data['name']:
-                print("   ❌ No business name found with any selector")
-            
-            # Extract address
-            print("\n📍 Extracting business address...")
-            address_selectors = [
-                '[data-item-id="address"] .Io6YTe',
-                '[data-attrid="kc:/location/location:address"]',
-                '.LrzXr',
-                '[data-value="Directions"]',
-                'button[data-value="Directions"] .Io6YTe',
-                '.rogA2c .Io6YTe'
-            ]
-            
-            for i, selector in enumerate(address_selectors, 1):
-                print(f"   [{i}/{len(address_selectors)}] Trying address selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        if text and text.strip():
-                            business_data['address'] = text.strip()
-                            print(f"   ✅ Found address: '{business_data['address']}'")
-                            break
-                        else:
-                            print(f"   ⚠ Element found but no text content")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
-            
-            if not business_data['address']:
-                print("   ❌ No business address found with any selector")
-            
-            # Extract phone number
-            print("\n📞 Extracting business phone...")
-            phone_selectors = [
-                # Primary phone selectors
-                '[data-item-id="phone"] .Io6YTe',
-                'button[data-value*="tel:"] .Io6YTe',
-                'a[href^="tel:"]',
-                '[data-attrid*="phone"]',
-                # Additional comprehensive selectors
-                'button[jsaction*="phone"] .Io6YTe',
-                '.rogA2c button[data-value*="tel:"]',
-                '.CsEnBe[aria-label*="phone"]',
-                '.CsEnBe[aria-label*="Phone"]',
-                'button[aria-label*="phone"] .Io6YTe',
-                'button[aria-label*="Phone"] .Io6YTe',
-                '.Io6YTe[aria-label*="phone"]',
-                '.Io6YTe[aria-label*="Phone"]',
-                # Fallback selectors
-                'a[href*="tel:"]',
-                'span[aria-label*="phone"]',
-                'span[aria-label*="Phone"]',
-                # Generic phone pattern selectors
-                'button:has-text("+")',
-                'span:has-text("+")',
-                '.Io6YTe:has-text("+")',
-                # Contact section selectors
-                '[data-value="Call"] .Io6YTe',
-                'button[data-value="Call"] .Io6YTe'
-            ]
-            
-            for i, selector in enumerate(phone_selectors, 1):
-                print(f"   [{i}/{len(phone_selectors)}] Trying phone selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        href = await element.get_attribute('href')
-                        aria_label = await element.get_attribute('aria-label')
-                        
-                        # Try multiple sources for phone text
-                        phone_sources = [
-                            text,
-                            href.replace('tel:', '') if href and href.startswith('tel:') else '',
-                            aria_label
-                        ]
-                        
-                        phone_text = ''
-                        for source in phone_sources:
-                            if source and source.strip():
-                                phone_text = source.strip()
-                                break
-                        
-                        print(f"   Raw phone text: '{phone_text}', href: '{href}', aria-label: '{aria_label}'")
-                        
-                        if phone_text:
-                            # More comprehensive phone pattern matching
-                            phone_patterns = [
-                                r'\+?[0-9\s\-\(\)]{7,}',  # General phone pattern
-                                r'\+\d{1,3}[\s\-]?\(?\d{1,4}\)?[\s\-]?\d{1,4}[\s\-]?\d{1,9}',  # International
-                                r'\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}',  # US format
-                                r'\d{2,4}[\s\-]\d{3,4}[\s\-]\d{3,4}',  # General format
-                                r'[0-9\+\-\(\)\s]{7,}'  # Fallback pattern
-                            ]
-                            
-                            for pattern in phone_patterns:
-                                match = re.search(pattern, phone_text)
-                                if match:
-                                    found_phone = match.group(0).strip()
-                                    # Validate it has enough digits
-                                    digit_count = len(re.findall(r'\d', found_phone))
-                                    if digit_count >= 7:  # Minimum 7 digits for a valid phone
-                                        business_data['phone'] = found_phone
-                                        print(f"   ✅ Found phone: '{business_data['phone']}' (pattern: {pattern})")
-                                        break
-                            
-                            if business_data['phone']:
-                                break
-                            else:
-                                digit_count = len(re.findall(r'\d', phone_text))
-                                print(f"   ⚠ Text found but no valid phone pattern match (digits: {digit_count})")
-                        else:
-                            print(f"   ⚠ Element found but no phone text")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
+                business_data['name'] = self._pick_field(candidates, 'name', _candidate_text)
+            business_data['address'] = self._pick_field(candidates, 'address', _candidate_text)
+            business_data['phone'] = self._pick_field(candidates, 'phone', _candidate_phone)
             
             # Additional fallback: search for phone patterns in all visible text
             if not business_data['phone']:
-                print("   🔍 Fallback: Searching for phone patterns in all visible text...")
+                logger.debug("No phone from selectors, searching the panel text")
                 try:
                     # Get all text content from the business details panel
-                    panel_text = await self.page.evaluate('''
-                        () => {
-                            const panel = document.querySelector('[role="main"]') || document.body;
-                            return panel.innerText || panel.textContent || '';
-                        }
-                    ''')
+                    panel_text = await page.evaluate("() => window.__smPanelText()")
                     
                     if panel_text:
                         # Look for phone patterns in the full text
-                        phone_patterns = [
-                            r'\+\d{1,3}[\s\-]?\(?\d{1,4}\)?[\s\-]?\d{1,4}[\s\-]?\d{1,9}',
-                            r'\(?\d{3}\)?[\s\-]?\d{3}[\s\-]?\d{4}',
-                            r'\d{2,4}[\s\-]\d{3,4}[\s\-]\d{3,4}'
-                        ]
-                        
-                        for pattern in phone_patterns:
-                            matches = re.findall(pattern, panel_text)
-                            for match in matches:
-                                digit_count = len(re.findall(r'\d', match))
-                                if digit_count >= 7:
-                                    business_data['phone'] = match.strip()
-                                    print(f"   ✅ Found phone in text: '{business_data['phone']}'")
-                                    break
-                            if business_data['phone']:
+                        for match in _PANEL_PHONE_RE.finditer(panel_text):
+                            found_phone = match.group(0)
+                            if _digit_count(found_phone) >= 7:
+                                business_data['phone'] = found_phone.strip()
                                 break
                 except Exception as e:
                     print(f"   ⚠ Error in fallback phone search: {e}")
             
-            if not business_data['phone']:
-                print("   ❌ No business phone found with any method")
-            
-            # Extract website
-            print("\n🌐 Extracting business website...")
-            website_selectors = [
-                '[data-item-id="authority"] a',
-                'a[data-value="Website"]',
-                'a[href^="http"]:not([href*="google.com"]):not([href*="maps"])',
-                '[data-attrid*="website"] a'
-            ]
-            
-            for i, selector in enumerate(website_selectors, 1):
-                print(f"   [{i}/{len(website_selectors)}] Trying website selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        href = await element.get_attribute('href')
-                        print(f"   Found href: '{href}'")
-                        if href and 'google.com' not in href and 'maps' not in href:
-                            business_data['website'] = href
-                            print(f"   ✅ Found website: '{business_data['website']}'")
-                            break
-                        else:
-                            print(f"   ⚠ Href found but contains google.com or maps")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
-            
-            if not business_data['website']:
-                print("   ❌ No business website found with any selector")
-            
-            # Extract rating
-            print("\n⭐ Extracting business rating...")
-            rating_selectors = [
-                '.F7nice span[aria-hidden="true"]',
-                'span.ceNzKf[aria-label*="star"]',
-                '.MW4etd',
-                '[role="img"][aria-label*="star"]'
-            ]
-            
-            for i, selector in enumerate(rating_selectors, 1):
-                print(f"   [{i}/{len(rating_selectors)}] Trying rating selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        aria_label = await element.get_attribute('aria-label')
-                        
-                        rating_text = text or aria_label or ''
-                        print(f"   Raw rating text: '{rating_text}', aria-label: '{aria_label}'")
-                        
-                        match = re.search(r'([0-9]\.[0-9])', rating_text)
-                        if match:
-                            business_data['rating'] = match.group(1)
-                            print(f"   ✅ Found rating: '{business_data['rating']}'")
-                            break
-                        else:
-                            print(f"   ⚠ Text found but no rating pattern match")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
-            
+            business_data['website'] = self._pick_field(candidates, 'website', _candidate_website)
             if not business_data['rating']:
-                print("   ❌ No business rating found with any selector")
-            
-            # Extract reviews count
-            print("\n📝 Extracting business reviews count...")
-            review_selectors = [
-                '.F7nice .RDApEe',
-                '.UY7F9',
-                'button[jsaction*="reviews"] .RDApEe',
-                '[aria-label*="review"]'
-            ]
-            
-            for i, selector in enumerate(review_selectors, 1):
-                print(f"   [{i}/{len(review_selectors)}] Trying reviews selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        aria_label = await element.get_attribute('aria-label')
-                        
-                        review_text = text or aria_label or ''
-                        print(f"   Raw reviews text: '{review_text}', aria-label: '{aria_label}'")
-                        
-                        match = re.search(r'([0-9,]+)', review_text)
-                        if match:
-                            business_data['reviews'] = match.group(1).replace(',', '')
-                            print(f"   ✅ Found reviews count: '{business_data['reviews']}'")
-                            break
-                        else:
-                            print(f"   ⚠ Text found but no number pattern match")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
-            
+                business_data['rating'] = self._pick_field(candidates, 'rating', _candidate_rating)
             if not business_data['reviews']:
-                print("   ❌ No business reviews count found with any selector")
-            
-            # Extract category
-            print("\n🏷️ Extracting business category...")
-            category_selectors = [
-                'button[jsaction*="category"] .DkEaL',
-                '.DkEaL',
-                '[data-attrid*="category"]',
-                '.YhemCb .DkEaL'
-            ]
-            
-            for i, selector in enumerate(category_selectors, 1):
-                print(f"   [{i}/{len(category_selectors)}] Trying category selector: '{selector}'")
-                try:
-                    element = await self.page.query_selector(selector)
-                    if element:
-                        text = await element.text_content()
-                        print(f"   Found category text: '{text}'")
-                        if text and text.strip():
-                            business_data['category'] = text.strip()
-                            print(f"   ✅ Found category: '{business_data['category']}'")
-                            break
-                        else:
-                            print(f"   ⚠ Element found but no text content")
-                    else:
-                        print(f"   ✗ No element found")
-                except Exception as e:
-                    print(f"   ⚠ Error with selector: {e}")
-                    continue
-            
+                business_data['reviews'] = self._pick_field(candidates, 'reviews', _candidate_reviews)
             if not business_data['category']:
-                print("   ❌ No business category found with any selector")
+                business_data['category'] = self._pick_field(candidates, 'category', _candidate_text)
+            
+            self._extraction_count += 1
+            if self._extraction_count % self.FIELD_REORDER_INTERVAL == 0:
+                self._reorder_field_selectors()
             
-            print(f"\n🎯 Final extracted data summary:")
-            print(f"   Name: '{business_data['name']}'")
-            print(f"   Address: '{business_data['address']}'")
-            print(f"   Phone: '{business_data['phone']}'")
-            print(f"   Website: '{business_data['website']}'")
-            print(f"   Rating: '{business_data['rating']}'")
-            print(f"   Reviews: '{business_data['reviews']}'")
-            print(f"   Category: '{business_data['category']}'")
+            logger.debug("Extracted business data: %s", business_data)
             
         except Exception as e:
             print(f"❌ Error extracting business data: {e}")
         
         return business_data
     
-    async def _wait_for_business_panel(self, progress_callback=None):
-        """Wait for business details panel to load properly"""
+    def _pick_field(self, candidates, field, extract) -> str:
+        """Take a field's first accepted candidate and count the selector that supplied it"""
+        value, selector = _first_match(candidates[field], extract)
+        if selector:
+            self._field_hits[field][selector] += 1
+        return value
+    
+    def _reorder_field_selectors(self):
+        """Try each field's most productive selectors first; ties keep the reliability order"""
+        self._field_selectors = {
+            field: sorted(selectors, key=lambda selector, hits=self._field_hits[field]: -hits[selector])
+            for field, selectors in _FIELD_SELECTORS.items()
+        }
+    
+    async def _wait_for_business_panel(self, page: Page, progress_callback=None, place_token=''):
+        """Wait for business details panel to load, for the listing identified by place_token if given"""
         try:
             if progress_callback:
                 progress_callback.emit("⏳ Waiting for business details to load...")
             
-            # Wait for any of these elements that indicate the panel has loaded
-            panel_indicators = [
-                'h1[data-attrid="title"]',  # Business name
-                'h1.DUwDvf',  # Alternative business name
-                '[data-item-id="address"]',  # Address section
-                '.F7nice',  # Rating section
-                'h1'  # Fallback to any h1
-            ]
-            
-            # Try to wait for panel indicators with timeout
-            for selector in panel_indicators:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    if progress_callback:
-                        progress_callback.emit("✅ Business details panel loaded")
-                    
-                    # Reduced wait for content to stabilize
-                    await asyncio.sleep(0.3)
-                    return True
-                except:
-                    continue
+            # Wait for whichever element indicating the panel has loaded shows up
+            # first; a panel still showing the previous business does not count
+            try:
+                await page.wait_for_function(
+                    "([selector, placeToken]) => window.__smPanelReady(selector, placeToken)",
+                    arg=[_PANEL_SELECTOR, place_token],
+                    timeout=5000
+                )
+                if progress_callback:
+                    progress_callback.emit("✅ Business details panel loaded")
+                return True
+            except Exception:
+                pass
             
-            # If no specific indicators found, wait a bit more
+            # If no specific indicators found, settle for the document being parsed
             if progress_callback:
                 progress_callback.emit("⚠️ Panel indicators not found, using fallback wait")
-            await asyncio.sleep(3)
+            await page.wait_for_load_state('domcontentloaded', timeout=3000)
             return True
             
         except Exception as e:
             if progress_callback:
                 progress_callback.emit(f"⚠️ Error waiting for panel: {str(e)}")
-            await asyncio.sleep(1)  # Reduced fallback wait
             return False
     
     async def close_browser(self):
         """Close the browser context and browser if needed"""
         try:
             if self.browser_context:
+                # A persistent profile keeps its own cookies; a clean context
+                # saves its session so the next one starts logged in and warm
+                if self.browser:
+                    await self._save_storage_state()
                 await self.browser_context.close()
                 self.browser_context = None
             
@@ -1043,120 +1437,376 @@ class GoogleMapsScraper:
                 await self.browser.close()
                 self.browser = None
                 
-            # Clean up temporary profile directory
-            if hasattr(self, 'temp_profile'):
-                import shutil
-                try:
-                    shutil.rmtree(self.temp_profile)
-                except Exception as cleanup_error:
-                    print(f"Warning: Could not clean up temp profile: {cleanup_error}")
-                delattr(self, 'temp_profile')
-                
-            self.page = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
         except Exception as e:
             print(f"Error closing browser: {e}")
 
+    async def _save_storage_state(self):
+        """Snapshot the context's cookies and local storage for the next run"""
+        try:
+            state = await self.browser_context.storage_state()
+            self._make_private_dir(self.APP_DIR)
+            # Written owner-only to a temp file and swapped in, so a crash
+            # mid-write never leaves a truncated snapshot for open_context
+            tmp_path = f"{self.STORAGE_STATE_PATH}.tmp"
+            fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            os.chmod(tmp_path, 0o600)  # In case a leftover temp file had a wider mode
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.STORAGE_STATE_PATH)
+        except Exception as e:
+            print(f"Error saving browser state: {e}")
+
+
+class BrowserPool:
+    """Keeps one warm browser on a dedicated event loop across scraping runs
+    
+    Playwright objects are bound to the event loop that created them, so the
+    pool runs a persistent loop on a daemon thread and ScrapingThread submits
+    its coroutine there instead of calling asyncio.run.
+    """
+    
+    def __init__(self, headless=True):
+        self.loop = asyncio.new_event_loop()
+        self.scraper = GoogleMapsScraper(headless=headless)
+        self._browser_key = None  # (chrome_path, profile_path) of the running browser
+        self._thread = threading.Thread(target=self.loop.run_forever, name="BrowserPool", daemon=True)
+        self._thread.start()
+    
+    def submit(self, coro):
+        """Schedule a coroutine on the pool's event loop and return its future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    async def acquire(self, scraping_thread, chrome_path=None, profile_path=None, progress_callback=None) -> bool:
+        """Hand the warm scraper to a run, launching the browser if needed"""
+        self.scraper.scraping_thread = scraping_thread
+        
+        if self.scraper.browser_context and self._browser_key == (chrome_path, profile_path):
+            try:
+                # Cheap liveness probe in case the user closed the window
+                probe = await self.scraper.browser_context.new_page()
+                await probe.close()
+                if progress_callback:
+                    progress_callback.emit("♻️ Reusing running browser")
+                return True
+            except Exception:
+                pass
+            
+            # A closed context on a live browser only needs a new context
+            if self.scraper.browser and self.scraper.browser.is_connected():
+                try:
+                    await self.scraper.browser_context.close()
+                except Exception:
+                    pass
+                try:
+                    self.scraper.browser_context = await self.scraper.open_context()
+                    if progress_callback:
+                        progress_callback.emit("♻️ Reusing running browser with a fresh context")
+                    return True
+                except Exception:
+                    pass
+        
+        await self.scraper.close_browser()
+        setup_success = await self.scraper.setup_browser(chrome_path, profile_path, progress_callback)
+        self._browser_key = (chrome_path, profile_path) if setup_success else None
+        return setup_success
+    
+    def shutdown(self, timeout=10):
+        """Close the browser and stop the event loop"""
+        if not self._thread.is_alive():
+            return
+        try:
+            self.submit(self.scraper.close_browser()).result(timeout)
+        except Exception as e:
+            print(f"Error closing pooled browser: {e}")
+        self._browser_key = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+
+class CoalescedProgress:
+    """Progress emitter that batches messages into at most one signal per interval
+    
+    Drop-in for a pyqtSignal(str) passed as progress_callback: messages are
+    joined with newlines, and a batch that is still waiting when the run
+    goes quiet is sent by a timer on the running event loop.
+    """
+    
+    def __init__(self, signal, interval=0.1):
+        self._signal = signal
+        self._interval = interval
+        self._buffer = []
+        self._last_emit = 0.0
+        self._pending_flush = None
+    
+    def emit(self, message):
+        """Buffer a message, sending the batch once the interval has passed"""
+        self._buffer.append(message)
+        now = time.monotonic()
+        if now - self._last_emit >= self._interval:
+            self.flush()
+        elif self._pending_flush is None:
+            try:
+                self._pending_flush = asyncio.get_running_loop().call_later(self._interval, self.flush)
+            except RuntimeError:
+                self.flush()  # No event loop to defer to
+    
+    def flush(self):
+        """Send any buffered messages now"""
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+        if self._buffer:
+            self._last_emit = time.monotonic()
+            self._signal.emit('\n'.join(self._buffer))
+            self._buffer.clear()
+
+
+class BatchTee:
+    """business_callback stand-in that writes each batch out before forwarding it
+    
+    Lets rows reach the output file as soon as the scraper delivers them
+    rather than when the keyword they belong to finishes.
+    """
+    
+    def __init__(self, signal, write):
+        self._signal = signal
+        self._write = write
+    
+    def emit(self, batch):
+        """Write a batch, then pass it on to the signal"""
+        self._write(batch)
+        self._signal.emit(batch)
+
 
 class ScrapingThread(QThread):
     """Thread for running the scraping process"""
     progress_signal = pyqtSignal(str)
-    business_signal = pyqtSignal(dict)
+    business_signal = pyqtSignal(list)  # Batches of Business records
     finished_signal = pyqtSignal(int)
     keyword_signal = pyqtSignal(str)  # New signal for current keyword updates
+    keyword_done_signal = pyqtSignal(int, int)  # Keywords completed, total keywords
+    
+    # Default number of keywords scraped concurrently; one reusable page per slot
+    MAX_CONCURRENT_KEYWORDS = 5
+    
+    # Column order of the output CSV file
+    CSV_FIELDNAMES = ('name', 'address', 'phone', 'website', 'rating', 'reviews', 'category', 'keyword')
     
-    def __init__(self, keywords, chrome_path, profile_path, output_file):
+    # C-level row extraction; every extracted business carries all of these keys
+    _csv_row = attrgetter(*CSV_FIELDNAMES)
+    
+    # Output file buffer, and rows written between explicit flushes to disk
+    CSV_BUFFER_SIZE = 1 << 20
+    CSV_FLUSH_ROWS = 64
+    
+    def __init__(self, keywords, chrome_path, profile_path, output_file, browser_pool=None, max_concurrent=None):
         super().__init__()
         self.keywords = keywords
+        self.max_concurrent = max_concurrent or self.MAX_CONCURRENT_KEYWORDS
         self.chrome_path = chrome_path
         self.profile_path = profile_path
         self.output_file = output_file
-        self.scraper = GoogleMapsScraper(self)
+        self.browser_pool = browser_pool
+        self.scraper = browser_pool.scraper if browser_pool else GoogleMapsScraper(self)
+        # Everything the run reports goes through here, so the UI thread
+        # receives a few signals per second instead of one per message
+        self.progress = CoalescedProgress(self.progress_signal)
+        # Batches are appended to the CSV file on their way to the UI
+        self._business_sink = BatchTee(self.business_signal, self._append_to_csv)
         self.is_running = True
         self.is_paused = False
+        # Set while running, cleared while paused; created on the scraping
+        # loop and driven from the UI thread through call_soon_threadsafe
+        self._loop = None
+        self._pause_event = None
+        self.total_count = 0
+        self.completed_keywords = 0
+        self._csv_file = None
+        self._csv_writer = None
+        self._unflushed_rows = 0
         
     def stop(self):
         """Stop the scraping process"""
         self.is_running = False
         self.is_paused = False
+        self._set_pause_event(True)
         
     def pause(self):
         """Pause the scraping process"""
         self.is_paused = True
+        self._set_pause_event(False)
         
     def resume(self):
         """Resume the scraping process"""
         self.is_paused = False
+        self._set_pause_event(True)
+    
+    def _set_pause_event(self, running):
+        """Set or clear the pause event on the scraping loop from any thread"""
+        if self._loop is None:
+            return
+        action = self._pause_event.set if running else self._pause_event.clear
+        try:
+            self._loop.call_soon_threadsafe(action)
+        except RuntimeError:
+            # The loop has already closed, so the run is over
+            pass
+    
+    async def wait_while_paused(self):
+        """Sleep until resumed or stopped; returns whether the run should continue"""
+        if self._pause_event is not None:
+            await self._pause_event.wait()
+        return self.is_running
     
     def run(self):
         """Main scraping execution"""
-        asyncio.run(self._run_scraping())
+        if self.browser_pool:
+            # Block this thread until the run finishes on the pool's loop
+            self.browser_pool.submit(self._run_scraping()).result()
+        else:
+            asyncio.run(self._run_scraping())
     
     async def _run_scraping(self):
         """Async scraping execution"""
+        # The loop is published last so pause() either sees it or leaves
+        # is_paused for the initial state below
+        self._pause_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        if not self.is_paused:
+            self._pause_event.set()
+        
         try:
-            # Setup browser
-            setup_success = await self.scraper.setup_browser(
-                self.chrome_path, 
-                self.profile_path, 
-                self.progress_signal
-            )
+            # Setup browser, reusing the pooled one when available
+            if self.browser_pool:
+                setup_success = await self.browser_pool.acquire(
+                    self,
+                    self.chrome_path,
+                    self.profile_path,
+                    self.progress
+                )
+            else:
+                setup_success = await self.scraper.setup_browser(
+                    self.chrome_path, 
+                    self.profile_path, 
+                    self.progress
+                )
             
             if not setup_success:
+                self.progress.flush()
                 self.finished_signal.emit(0)
                 return
             
-            all_businesses = []
+            # Results are streamed to the CSV file batch by batch as they are scraped
+            if self.output_file:
+                self._open_csv()
             
-            # Process each keyword
-            for keyword in self.keywords:
-                if not self.is_running:
-                    break
-                
-                # Wait if paused
-                while self.is_paused:
-                    await asyncio.sleep(0.1)
-                    if not self.is_running:
-                        break
-                
-                if not self.is_running:
-                    break
-                
-                self.keyword_signal.emit(keyword)
-                
-                # Search for businesses
-                businesses = await self.scraper.search_keyword(
-                    keyword, 
-                    self.progress_signal, 
-                    self.business_signal
+            # Process keywords concurrently on a fixed set of pages; the
+            # queue hands each keyword a free page and bounds concurrency
+            pages = asyncio.Queue()
+            for _ in range(min(self.max_concurrent, len(self.keywords))):
+                pages.put_nowait(await self.scraper.browser_context.new_page())
+            try:
+                await asyncio.gather(
+                    *(self._scrape_keyword(keyword, pages) for keyword in self.keywords)
                 )
-                
-                all_businesses.extend(businesses)
-            
-            # Save results to CSV
-            if all_businesses and self.output_file:
-                self._save_to_csv(all_businesses)
+            finally:
+                await self._close_pages(pages)
             
-            # Close browser
-            await self.scraper.close_browser()
+            if self._csv_writer:
+                self.progress.emit(f"✅ Saved {self.total_count} businesses to {self.output_file}")
             
-            self.finished_signal.emit(len(all_businesses))
+            self.progress.flush()
+            self.finished_signal.emit(self.total_count)
             
         except Exception as e:
-            self.progress_signal.emit(f"❌ Scraping error: {str(e)}")
+            self.progress.emit(f"❌ Scraping error: {str(e)}")
+            self.progress.flush()
             self.finished_signal.emit(0)
+        finally:
+            self._close_csv()
+            self.progress.flush()
+            
+            # Close browser unless it is kept warm by the pool
+            if not self.browser_pool:
+                await self.scraper.close_browser()
     
-    def _save_to_csv(self, businesses):
-        """Save business data to CSV file"""
+    async def _scrape_keyword(self, keyword, pages):
+        """Scrape a single keyword on a page borrowed from the shared set"""
+        page = await pages.get()
         try:
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['name', 'address', 'phone', 'website', 'rating', 'reviews', 'category', 'keyword']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for business in businesses:
-                    writer.writerow(business)
-                    
-            self.progress_signal.emit(f"✅ Saved {len(businesses)} businesses to {self.output_file}")
+            # Wait if paused
+            if not await self.wait_while_paused():
+                return
             
+            self.keyword_signal.emit(keyword)
+            
+            # Replace a page that crashed or was closed on an earlier keyword
+            if page.is_closed():
+                page = await self.scraper.browser_context.new_page()
+            
+            # Search for businesses
+            businesses = await self.scraper.search_keyword(
+                keyword,
+                page,
+                self.progress,
+                self._business_sink
+            )
+        finally:
+            pages.put_nowait(page)
+        
+        self.total_count += len(businesses)
+        
+        # Keywords finish out of order, so progress counts completions
+        self.completed_keywords += 1
+        self.keyword_done_signal.emit(self.completed_keywords, len(self.keywords))
+    
+    async def _close_pages(self, pages):
+        """Close every page left in the shared set"""
+        while not pages.empty():
+            page = pages.get_nowait()
+            try:
+                if not page.is_closed():
+                    await page.close()
+            except Exception as e:
+                print(f"Error closing page: {e}")
+    
+    def _open_csv(self):
+        """Open the output CSV file and write the header row"""
+        try:
+            self._csv_file = open(self.output_file, 'w', newline='', encoding='utf-8', buffering=self.CSV_BUFFER_SIZE)
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(self.CSV_FIELDNAMES)
         except Exception as e:
-            self.progress_signal.emit(f"❌ Error saving CSV: {str(e)}")
\ No newline at end of file
+            self.progress.emit(f"❌ Error opening CSV: {str(e)}")
+            self._close_csv()
+    
+    def _append_to_csv(self, businesses):
+        """Append a batch of business data to the output CSV file"""
+        if not self._csv_writer or not businesses:
+            return
+        
+        try:
+            self._csv_writer.writerows(map(self._csv_row, businesses))
+            
+            # Small batches share one flush; the file is flushed on close regardless
+            self._unflushed_rows += len(businesses)
+            if self._unflushed_rows >= self.CSV_FLUSH_ROWS:
+                self._csv_file.flush()
+                self._unflushed_rows = 0
+            
+        except Exception as e:
+            self.progress.emit(f"❌ Error saving CSV: {str(e)}")
+    
+    def _close_csv(self):
+        """Close the output CSV file if it is open"""
+        if self._csv_file:
+            try:
+                self._csv_file.close()
+            except Exception as e:
+                self.progress.emit(f"❌ Error closing CSV: {str(e)}")
+        self._csv_file = None
+        self._csv_writer = None
+        self._unflushed_rows = 0
@@ -1,38 +1,562 @@
 import sys
 import os
-import csv
 import time
+from collections import deque
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QGridLayout, QLabel, QPushButton, QTextEdit, QLineEdit, QFileDialog, 
+    QGridLayout, QLabel, QPushButton, QTextEdit, QPlainTextEdit, QLineEdit, QFileDialog, 
     QMessageBox, QProgressBar, QGroupBox, QScrollArea, QFrame, QSplitter, 
-    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
+    QTabWidget, QTableView, QHeaderView, QComboBox,
     QSpinBox, QCheckBox, QSlider, QStatusBar, QMenuBar, QMenu, QAction,
     QSystemTrayIcon, QStyle, QDesktopWidget, QDialog, QDialogButtonBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QSize, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
+)
 from PyQt5.QtGui import QFont, QIcon, QPixmap, QPalette, QColor, QLinearGradient
 
 from ..license import LicenseManager, LicenseDialog
-from ..scraping import GoogleMapsScraper, ScrapingThread
-from ..database import CSVHandler, DataValidator
+from ..scraping import GoogleMapsScraper, ScrapingThread, BrowserPool
+from ..database import CSVHandler, DataValidator, Business
 from ..utils import LocationDataLoader, KeywordGenerator, FileUtils
 from ..config import AppSettings
 
 
+# Application-wide dark theme, applied once by apply_modern_theme
+_MAIN_STYLESHEET = """
+    /* Main Window */
+    QMainWindow {
+        background-color: #010409;
+        color: #f0f6fc;
+    }
+    
+    /* Header */
+    #headerFrame {
+        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: 0 #161b22, stop: 1 #21262d);
+        border-bottom: 2px solid #58a6ff;
+    }
+    
+    #titleLabel {
+        font-size: 24px;
+        font-weight: bold;
+        color: #ffffff;
+        margin-left: 10px;
+    }
+    
+    #licenseBtn {
+        background-color: #007acc;
+        color: #ffffff;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 13px;
+        font-family: Arial;
+    }
+
+    #licenseBtn:hover {
+        background-color: #005a9e;
+        color: #ffffff;
+    }
+    
+    /* Tabs */
+    QTabWidget::pane {
+        border: 1px solid #30363d;
+        background-color: #010409;
+    }
+    
+    QTabBar::tab {
+        background-color: #21262d;
+        color: #f0f6fc;
+        padding: 12px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #58a6ff;
+    }
+    
+    QTabBar::tab:hover {
+        background-color: #30363d;
+    }
+    
+    /* Input Fields */
+    QTextEdit, QPlainTextEdit, QLineEdit {
+        background-color: #0d1117;
+        color: #f0f6fc;
+        border: 1px solid #30363d;
+        border-radius: 4px;
+        padding: 8px;
+        font-size: 12px;
+    }
+    
+    QTextEdit:focus, QPlainTextEdit:focus, QLineEdit:focus {
+        border: 2px solid #58a6ff;
+    }
+    
+    /* Buttons */
+    QPushButton {
+        background-color: #21262d;
+        color: #f0f6fc;
+        border: 1px solid #30363d;
+        padding: 10px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 13px;
+        font-family: Arial;
+        text-align: center;
+        min-width: 100px;
+    }
+
+    QPushButton:hover {
+        background-color: #30363d;
+        border: 1px solid #58a6ff;
+        color: #f0f6fc;
+    }
+
+    QPushButton:pressed {
+        background-color: #161b22;
+        color: #f0f6fc;
+    }
+
+    QPushButton:disabled {
+        background-color: #21262d;
+        color: #6e7681;
+    }
+    
+    /* Specific Button Styles */
+    #startBtn, #pauseBtn, #resumeBtn, #stopBtn,
+    #saveBtn, #saveUniqueBtn, #clearBtn {
+        color: #ffffff;
+    }
+
+    #startBtn {
+        background-color: #16a085;
+    }
+
+    #startBtn:hover {
+        background-color: #1abc9c;
+    }
+
+    #pauseBtn, #resumeBtn {
+        background-color: #f39c12;
+    }
+
+    #pauseBtn:hover, #resumeBtn:hover {
+        background-color: #e67e22;
+    }
+
+    #stopBtn {
+        background-color: #e74c3c;
+    }
+
+    #stopBtn:hover {
+        background-color: #c0392b;
+    }
+
+    #saveBtn, #saveUniqueBtn {
+        background-color: #8e44ad;
+    }
+
+    #saveBtn:hover, #saveUniqueBtn:hover {
+        background-color: #9b59b6;
+    }
+
+    #clearBtn {
+        background-color: #95a5a6;
+    }
+
+    #clearBtn:hover {
+        background-color: #7f8c8d;
+    }
+    
+    /* Results Table */
+    #resultsFrame {
+        background-color: #0d1117;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+    }
+    
+    #resultsTable {
+        background-color: #0d1117;
+        alternate-background-color: #161b22;
+        color: #f0f6fc;
+        gridline-color: #30363d;
+        border: none;
+    }
+    
+    QHeaderView::section {
+        background-color: #21262d;
+        color: #f0f6fc;
+        padding: 8px;
+        border: 1px solid #30363d;
+        font-weight: bold;
+    }
+    
+    /* Progress Log */
+    #progressLog {
+        background-color: #0d1117;
+        color: #f0f6fc;
+        border: 1px solid #30363d;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 11px;
+    }
+    
+    /* Labels */
+    #inputLabel {
+        font-size: 12px;
+        font-weight: bold;
+        color: #8b949e;
+        margin-bottom: 5px;
+    }
+    
+    /* Input Fields */
+    #keywordsInput {
+        background-color: #0d1117;
+        color: #f0f6fc;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 12px;
+    }
+    
+    #keywordsInput:focus {
+        border: 2px solid #1f6feb;
+        background-color: #161b22;
+    }
+    
+    /* Combo Boxes */
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #f0f6fc;
+        margin-right: 5px;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #21262d;
+        color: #f0f6fc;
+        selection-background-color: #58a6ff;
+        border: 1px solid #30363d;
+    }
+    
+    /* Status Bar */
+    #statusBar {
+        background-color: #0d1117;
+        color: #f0f6fc;
+        border-top: 1px solid #30363d;
+    }
+    
+    /* Dashboard Styles */
+    #dashboardTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #f0f6fc;
+        margin-bottom: 20px;
+    }
+    
+    #statsFrame {
+        background-color: #0d1117;
+        border: 1px solid #30363d;
+        border-radius: 8px;
+        padding: 15px;
+    }
+    
+    #statCard {
+        background-color: #161b22;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        margin: 5px;
+    }
+    
+    #statCard:hover {
+        border: 1px solid #58a6ff;
+    }
+    
+    #statIcon {
+        font-size: 20px;
+        margin-right: 8px;
+    }
+    
+    #statTitle {
+        font-size: 11px;
+        color: #8b949e;
+        font-weight: normal;
+    }
+    
+    #statValue {
+        font-size: 18px;
+        font-weight: bold;
+        color: #f0f6fc;
+    }
+    
+    #progressFrame {
+        background-color: #0d1117;
+        border: 1px solid #30363d;
+        border-radius: 8px;
+    }
+    
+    #progressTitle, #activityTitle {
+        font-size: 14px;
+        font-weight: bold;
+        color: #f0f6fc;
+        margin-bottom: 8px;
+    }
+    
+    #dashboardProgressBar {
+        background-color: #21262d;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        text-align: center;
+        color: #f0f6fc;
+        font-weight: bold;
+    }
+    
+    #dashboardProgressBar::chunk {
+        background-color: #58a6ff;
+        border-radius: 4px;
+    }
+    
+    #dashboardActivityLog {
+        background-color: #0d1117;
+        color: #f0f6fc;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 11px;
+        padding: 8px;
+    }
+    
+    /* Progress Bar */
+    QProgressBar, #progressBar {
+        background-color: #21262d;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        text-align: center;
+        color: #f0f6fc;
+        font-weight: bold;
+        height: 20px;
+    }
+    
+    QProgressBar::chunk, #progressBar::chunk {
+        background-color: #58a6ff;
+        border-radius: 4px;
+    }
+    
+    /* Spin Box */
+    QSpinBox, #maxResultsSpin {
+        background-color: #0d1117;
+        color: #f0f6fc;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        padding: 6px;
+        min-width: 80px;
+    }
+    
+    #maxResultsSpin:focus {
+        border: 2px solid #1f6feb;
+    }
+    
+    QSpinBox::up-button, QSpinBox::down-button {
+        background-color: #21262d;
+        border: none;
+        width: 16px;
+    }
+    
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: #58a6ff;
+    }
+    
+    #controlFrame {
+        background-color: #0d1117;
+        border: 1px solid #30363d;
+        border-radius: 8px;
+    }
+    
+    /* Settings Tab Styles */
+    #settingsTitle {
+        color: #f0f6fc;
+        font-size: 24px;
+        font-weight: bold;
+        margin-bottom: 20px;
+    }
+    
+    #settingsGroup {
+        background-color: #0d1117;
+        border: 2px solid #30363d;
+        border-radius: 12px;
+        padding: 15px;
+        margin: 10px;
+    }
+    
+    #settingsGroup QLabel {
+        color: #f0f6fc;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    
+    #currentDirDisplay {
+        background-color: #161b22;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        padding: 8px;
+        color: #8b949e;
+        font-family: 'Courier New', monospace;
+        font-size: 12px;
+    }
+    
+    #changeDirBtn, #resetDirBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a9eff, stop:1 #0078d4);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 13px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    
+    #changeDirBtn:hover, #resetDirBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5ba7ff, stop:1 #106ebe);
+    }
+    
+    #changeDirBtn:pressed, #resetDirBtn:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3a8eef, stop:1 #0066c4);
+    }
+"""
+
+
+class CSVSaveSignals(QObject):
+    """Signals emitted by CSVSaveWorker"""
+    finished = pyqtSignal(int, str)  # Row count, file path
+    error = pyqtSignal(str)
+
+
+class CSVSaveWorker(QRunnable):
+    """Writes businesses to a CSV file on a QThreadPool thread"""
+    
+    def __init__(self, businesses, file_path):
+        super().__init__()
+        self.businesses = businesses
+        self.file_path = file_path
+        self.signals = CSVSaveSignals()
+        
+    def run(self):
+        """Write the CSV file and report the outcome"""
+        try:
+            CSVHandler.write_businesses(self.businesses, self.file_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+            
+        self.signals.finished.emit(len(self.businesses), self.file_path)
+
+
+class BusinessTableModel(QAbstractTableModel):
+    """Read-only table model over scraped Business records
+    
+    Cells are rendered straight from the records, so no per-cell item objects
+    are created and painting cost follows the visible rows only.
+    """
+    
+    COLUMNS = ('keyword', 'name', 'website', 'phone', 'address', 'rating', 'category')
+    HEADERS = ('Keyword', 'Name', 'Website', 'Phone', 'Address', 'Rating', 'Category')
+    # Tuple position of each column's field, so data() indexes records directly
+    _FIELD_INDEXES = tuple(Business._fields.index(column) for column in COLUMNS)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self._rows[index.row()][self._FIELD_INDEXES[index.column()]]
+        # Scraped fields are already strings; only convert anything else
+        return value if type(value) is str else str(value)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def append_rows(self, rows):
+        """Append businesses with a single row-insertion notification"""
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+        
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+
 class ModernScraperGUI(QMainWindow):
     """Modern GUI for the Google Maps Scraper application"""
     
     def __init__(self):
         super().__init__()
         print("Initializing ModernScraperGUI...")
-        self.scraped_businesses = []
+        self.scraped_businesses = deque()  # Appended in batches; copied to a list only on export
+        self.unique_businesses_map = {}  # name/address fingerprint -> first business seen
         self.total_businesses = 0
         self.unique_businesses = 0
+        self._last_total = -1  # Last values shown on the dashboard stat cards
+        self._last_unique = -1
         self.scraping_thread = None
+        self.browser_pool = None  # Created on first scrape, keeps the browser warm
+        self._csv_save_workers = set()
+        
+        # Default paths (macOS Chrome install), resolved once
+        home_dir = Path.home()
+        self._chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+        self._chrome_profile_path = str(home_dir / "Library/Application Support/Google/Chrome")
+        self._desktop_dir = home_dir / "Desktop"
+        self._default_save_dir = str(home_dir / 'Downloads' / 'SoloScrapper')
+        
+        # Progress messages are buffered and appended to the log in one go
+        self._log_buffer = deque(maxlen=2000)
+        self._last_log_message = ''
+        self._timestamp_second = -1  # Cache for _timestamp; refreshed once per second
+        self._timestamp_text = ''
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_progress_log)
+        
+        # Incoming rows are buffered and added to the results table in bulk
+        self._pending_rows = []
+        self._row_flush_timer = QTimer(self)
+        self._row_flush_timer.setSingleShot(True)
+        self._row_flush_timer.timeout.connect(self._flush_pending_rows)
+        
+        # Dashboard stat cards are refreshed at most every 100 ms while scraping
+        self._stats_refresh_timer = QTimer(self)
+        self._stats_refresh_timer.setSingleShot(True)
+        self._stats_refresh_timer.timeout.connect(self._refresh_dashboard_stats)
         
         print("Creating license manager...")
         self.license_manager = LicenseManager()
@@ -90,11 +614,13 @@ class ModernScraperGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Create tabs
+        # Create tabs; keyword variations and settings are built on first visit
+        self._lazy_tabs = {}
         self.create_dashboard_tab()
-        self.create_keywords_variation_tab()
+        self._add_lazy_tab("🔤 Keyword Variations", self.create_keywords_variation_tab)
         self.create_google_maps_tab()
-        self.create_settings_tab()
+        self._add_lazy_tab("⚙️ Settings", self.create_settings_tab)
+        self.tab_widget.currentChanged.connect(self._build_lazy_tab)
         
         # Create status bar
         self.create_status_bar()
@@ -102,6 +628,19 @@ class ModernScraperGUI(QMainWindow):
         # Apply modern theme
         self.apply_modern_theme()
         
+    def _add_lazy_tab(self, title: str, builder):
+        """Add a placeholder tab that builder fills in when it is first shown"""
+        page = QWidget()
+        self._lazy_tabs[page] = builder
+        self.tab_widget.addTab(page, title)
+        
+    def _build_lazy_tab(self, index: int):
+        """Build a lazy tab's contents the first time it becomes current"""
+        page = self.tab_widget.widget(index)
+        builder = self._lazy_tabs.pop(page, None)
+        if builder:
+            builder(page)
+            
     def check_license_on_startup(self):
         """Check license validity on application startup"""
         try:
@@ -431,11 +970,8 @@ class ModernScraperGUI(QMainWindow):
         
         return card
         
-    def create_keywords_variation_tab(self):
+    def create_keywords_variation_tab(self, keywords_widget: QWidget):
         """Create the keywords variation tab with modern UI"""
-        keywords_widget = QWidget()
-        self.tab_widget.addTab(keywords_widget, "🔤 Keyword Variations")
-        
         # Main scroll area for better content management
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -854,8 +1390,8 @@ class ModernScraperGUI(QMainWindow):
         
     def generate_keyword_variations(self):
         """Generate keyword variations based on input"""
-        base_keywords = self.base_keyword_input.toPlainText().strip().split('\n')
-        base_keywords = [kw.strip() for kw in base_keywords if kw.strip()]
+        base_keywords = self.base_keyword_input.toPlainText().splitlines()
+        base_keywords = [kw for kw in (line.strip() for line in base_keywords) if kw]
         
         if not base_keywords:
             QMessageBox.warning(self, "No Keywords", "Please enter at least one base keyword.")
@@ -1100,10 +1636,12 @@ class ModernScraperGUI(QMainWindow):
         self.progress_bar.setObjectName("progressBar")
         layout.addWidget(self.progress_bar)
         
-        self.progress_log = QTextEdit()
+        # Plain text skips rich-text layout; old lines are dropped past the block limit
+        self.progress_log = QPlainTextEdit()
         self.progress_log.setObjectName("progressLog")
         self.progress_log.setMaximumHeight(100)
         self.progress_log.setReadOnly(True)
+        self.progress_log.setMaximumBlockCount(2000)
         layout.addWidget(self.progress_log)
         
         # Results section
@@ -1168,16 +1706,16 @@ class ModernScraperGUI(QMainWindow):
         results_layout = QVBoxLayout(results_frame)
         results_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.results_table = QTableWidget()
+        self.results_model = BusinessTableModel(self)
+        self.results_table = QTableView()
         self.results_table.setObjectName("resultsTable")
-        self.results_table.setColumnCount(7)
-        self.results_table.setHorizontalHeaderLabels([
-            "Keyword", "Name", "Website", "Phone", "Address", "Rating", "Category"
-        ])
+        self.results_table.setModel(self.results_model)
         
-        # Set column widths
+        # Set column widths; fixed sizing keeps row inserts from re-measuring cell contents
         header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setStretchLastSection(True)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         header.resizeSection(0, 150)  # Keyword
         header.resizeSection(1, 200)  # Name
         header.resizeSection(2, 200)  # Website
@@ -1187,11 +1725,8 @@ class ModernScraperGUI(QMainWindow):
         
         results_layout.addWidget(self.results_table)
         
-    def create_settings_tab(self):
+    def create_settings_tab(self, settings_widget: QWidget):
         """Create the settings tab"""
-        settings_widget = QWidget()
-        self.tab_widget.addTab(settings_widget, "⚙️ Settings")
-        
         layout = QVBoxLayout(settings_widget)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(20)
@@ -1268,7 +1803,7 @@ class ModernScraperGUI(QMainWindow):
                 
     def reset_save_directory(self):
         """Reset save directory to default"""
-        default_path = str(Path.home() / 'Downloads' / 'SoloScrapper')
+        default_path = self._default_save_dir
         try:
             self.settings.output_directory = default_path
             self.current_dir_display.setText(default_path)
@@ -1293,496 +1828,16 @@ class ModernScraperGUI(QMainWindow):
         
     def apply_modern_theme(self):
         """Apply modern dark theme to the application"""
-        self.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #010409;
-                color: #f0f6fc;
-            }
-            
-            /* Header */
-            #headerFrame {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #161b22, stop: 1 #21262d);
-                border-bottom: 2px solid #58a6ff;
-            }
-            
-            #titleLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #ffffff;
-                margin-left: 10px;
-            }
-            
-            #licenseBtn {
-                background-color: #007acc;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 13px;
-                font-family: Arial;
-            }
-
-            #licenseBtn:hover {
-                background-color: #005a9e;
-                color: #ffffff;
-            }
-            
-            /* Tabs */
-            QTabWidget::pane {
-                border: 1px solid #30363d;
-                background-color: #010409;
-            }
-            
-            QTabBar::tab {
-                background-color: #21262d;
-                color: #f0f6fc;
-                padding: 12px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #58a6ff;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #30363d;
-            }
-            
-            /* Input Fields */
-            QTextEdit, QLineEdit {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            
-            QTextEdit:focus, QLineEdit:focus {
-                border: 2px solid #58a6ff;
-            }
-            
-            /* Buttons */
-            QPushButton {
-                background-color: #21262d;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                padding: 10px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 13px;
-                font-family: Arial;
-                text-align: center;
-                min-width: 100px;
-            }
-
-            QPushButton:hover {
-                background-color: #30363d;
-                border: 1px solid #58a6ff;
-                color: #f0f6fc;
-            }
-
-            QPushButton:pressed {
-                background-color: #161b22;
-                color: #f0f6fc;
-            }
-
-            QPushButton:disabled {
-                background-color: #21262d;
-                color: #6e7681;
-            }
-            
-            /* Specific Button Styles */
-            #startBtn {
-                background-color: #16a085;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #startBtn:hover {
-                background-color: #1abc9c;
-                color: #ffffff;
-            }
-
-            #pauseBtn, #resumeBtn {
-                background-color: #f39c12;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #pauseBtn:hover, #resumeBtn:hover {
-                background-color: #e67e22;
-                color: #ffffff;
-            }
-
-            #stopBtn {
-                background-color: #e74c3c;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #stopBtn:hover {
-                background-color: #c0392b;
-                color: #ffffff;
-            }
-
-            #saveBtn, #saveUniqueBtn {
-                background-color: #8e44ad;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #saveBtn:hover, #saveUniqueBtn:hover {
-                background-color: #9b59b6;
-                color: #ffffff;
-            }
-
-            #clearBtn {
-                background-color: #95a5a6;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #clearBtn:hover {
-                background-color: #7f8c8d;
-                color: #ffffff;
-            }
-            
-            #copyBtn {
-                background-color: #3498db;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #copyBtn:hover {
-                background-color: #2980b9;
-                color: #ffffff;
-            }
-
-            #generateBtn {
-                background-color: #27ae60;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #generateBtn:hover {
-                background-color: #2ecc71;
-                color: #ffffff;
-            }
-
-            #clearVariationsBtn {
-                background-color: #e67e22;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #clearVariationsBtn:hover {
-                background-color: #d35400;
-                color: #ffffff;
-            }
-
-            #copyToScraperBtn {
-                background-color: #9b59b6;
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 13px;
-            }
-
-            #copyToScraperBtn:hover {
-                background-color: #8e44ad;
-                color: #ffffff;
-            }
-            
-            /* Results Table */
-            #resultsFrame {
-                background-color: #0d1117;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-            }
-            
-            #resultsTable {
-                background-color: #0d1117;
-                alternate-background-color: #161b22;
-                color: #f0f6fc;
-                gridline-color: #30363d;
-                border: none;
-            }
-            
-            QHeaderView::section {
-                background-color: #21262d;
-                color: #f0f6fc;
-                padding: 8px;
-                border: 1px solid #30363d;
-                font-weight: bold;
-            }
-            
-            /* Progress Log */
-            #progressLog {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 11px;
-            }
-            
-            /* Labels */
-            #sectionTitle {
-                font-size: 18px;
-                font-weight: bold;
-                color: #f0f6fc;
-                margin-bottom: 10px;
-            }
-            
-            #inputLabel {
-                font-size: 12px;
-                font-weight: bold;
-                color: #8b949e;
-                margin-bottom: 5px;
-            }
-            
-            /* Input Fields */
-            #baseKeywordInput, #keywordsInput {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            
-            #keywordsInput:focus {
-                border: 2px solid #1f6feb;
-                background-color: #161b22;
-            }
-            
-            /* Combo Boxes */
-            #countryCombo, #stateCombo, #cityCombo {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                padding: 6px;
-                min-width: 120px;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #f0f6fc;
-                margin-right: 5px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #21262d;
-                color: #f0f6fc;
-                selection-background-color: #58a6ff;
-                border: 1px solid #30363d;
-            }
-            
-            /* Status Bar */
-            #statusBar {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border-top: 1px solid #30363d;
-            }
-            
-            /* Dashboard Styles */
-            #dashboardTitle {
-                font-size: 24px;
-                font-weight: bold;
-                color: #f0f6fc;
-                margin-bottom: 20px;
-            }
-            
-            #statsFrame {
-                background-color: #0d1117;
-                border: 1px solid #30363d;
-                border-radius: 8px;
-                padding: 15px;
-            }
-            
-            #statCard {
-                background-color: #161b22;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                margin: 5px;
-            }
-            
-            #statCard:hover {
-                border: 1px solid #58a6ff;
-            }
-            
-            #statIcon {
-                font-size: 20px;
-                margin-right: 8px;
-            }
-            
-            #statTitle {
-                font-size: 11px;
-                color: #8b949e;
-                font-weight: normal;
-            }
-            
-            #statValue {
-                font-size: 18px;
-                font-weight: bold;
-                color: #f0f6fc;
-            }
-            
-            #progressFrame {
-                background-color: #0d1117;
-                border: 1px solid #30363d;
-                border-radius: 8px;
-            }
-            
-            #progressTitle, #activityTitle {
-                font-size: 14px;
-                font-weight: bold;
-                color: #f0f6fc;
-                margin-bottom: 8px;
-            }
-            
-            #dashboardProgressBar {
-                background-color: #21262d;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                text-align: center;
-                color: #f0f6fc;
-                font-weight: bold;
-            }
-            
-            #dashboardProgressBar::chunk {
-                background-color: #58a6ff;
-                border-radius: 4px;
-            }
-            
-            #dashboardActivityLog {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 11px;
-                padding: 8px;
-            }
-            
-            /* Progress Bar */
-            QProgressBar, #progressBar {
-                background-color: #21262d;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                text-align: center;
-                color: #f0f6fc;
-                font-weight: bold;
-                height: 20px;
-            }
-            
-            QProgressBar::chunk, #progressBar::chunk {
-                background-color: #58a6ff;
-                border-radius: 4px;
-            }
-            
-            /* Spin Box */
-            QSpinBox, #maxResultsSpin {
-                background-color: #0d1117;
-                color: #f0f6fc;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                padding: 6px;
-                min-width: 80px;
-            }
-            
-            #maxResultsSpin:focus {
-                border: 2px solid #1f6feb;
-            }
-            
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #21262d;
-                border: none;
-                width: 16px;
-            }
-            
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #58a6ff;
-            }
-            
-            /* Frames */
-            #inputFrame, #controlFrame {
-                background-color: #0d1117;
-                border: 1px solid #30363d;
-                border-radius: 8px;
-            }
-            
-            /* Settings Tab Styles */
-            #settingsTitle {
-                color: #f0f6fc;
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 20px;
-            }
-            
-            #settingsGroup {
-                background-color: #0d1117;
-                border: 2px solid #30363d;
-                border-radius: 12px;
-                padding: 15px;
-                margin: 10px;
-            }
-            
-            #settingsGroup QLabel {
-                color: #f0f6fc;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            
-            #currentDirDisplay {
-                background-color: #161b22;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                padding: 8px;
-                color: #8b949e;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-            
-            #changeDirBtn, #resetDirBtn {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #4a9eff, stop:1 #0078d4);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 13px;
-                font-weight: bold;
-                min-width: 120px;
-            }
-            
-            #changeDirBtn:hover, #resetDirBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #5ba7ff, stop:1 #106ebe);
-            }
-            
-            #changeDirBtn:pressed, #resetDirBtn:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 #3a8eef, stop:1 #0066c4);
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
+        
+    def closeEvent(self, event):
+        """Stop any running scrape and close the pooled browser on exit"""
+        if self.scraping_thread and self.scraping_thread.isRunning():
+            self.scraping_thread.stop()
+            self.scraping_thread.wait()
+        if self.browser_pool:
+            self.browser_pool.shutdown()
+        super().closeEvent(event)
         
     def show_license_dialog(self):
         """Show license dialog"""
@@ -1801,7 +1856,8 @@ class ModernScraperGUI(QMainWindow):
             QMessageBox.warning(self, "No Keywords", "Please enter keywords to scrape.")
             return
         
-        keywords = [kw.strip() for kw in keywords_text.split('\n') if kw.strip()]
+        # Strip and drop blank or repeated lines, keeping the first occurrence order
+        keywords = list(dict.fromkeys(kw for kw in (line.strip() for line in keywords_text.splitlines()) if kw))
         max_results = self.max_results_spin.value()
         
         # Update dashboard status
@@ -1811,17 +1867,23 @@ class ModernScraperGUI(QMainWindow):
                 status_value.setText("🔄 Starting...")
         
         # Get Chrome settings - using defaults for macOS
-        chrome_path = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-        profile_path = str(Path.home() / "Library/Application Support/Google/Chrome")
-        output_file = str(Path.home() / "Desktop" / "google_maps_results.csv")
-        
-        # Create and start scraping thread
-        self.scraping_thread = ScrapingThread(keywords, chrome_path, profile_path, output_file)
+        chrome_path = self._chrome_path
+        profile_path = self._chrome_profile_path
+        output_file = str(self._desktop_dir / "google_maps_results.csv")
+        
+        # Create and start scraping thread on the shared warm browser
+        if self.browser_pool is None:
+            self.browser_pool = BrowserPool(headless=self.settings.headless_mode)
+        self.scraping_thread = ScrapingThread(
+            keywords, chrome_path, profile_path, output_file, self.browser_pool,
+            max_concurrent=self.settings.max_concurrent
+        )
         self.scraping_thread.progress_signal.connect(self.log_progress)
-        self.scraping_thread.business_signal.connect(self.add_business_to_table)
+        self.scraping_thread.business_signal.connect(self.add_businesses_to_table)
         self.scraping_thread.business_signal.connect(self.update_dashboard_stats)
         self.scraping_thread.keyword_signal.connect(self.update_current_keyword)
         self.scraping_thread.keyword_signal.connect(self.update_dashboard_keyword)
+        self.scraping_thread.keyword_done_signal.connect(self.update_keyword_progress)
         self.scraping_thread.finished_signal.connect(self.scraping_finished)
         
         self.scraping_thread.start()
@@ -1889,60 +1951,60 @@ class ModernScraperGUI(QMainWindow):
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save All Results", 
-            str(Path.home() / "Desktop" / "all_businesses.csv"),
+            str(self._desktop_dir / "all_businesses.csv"),
             "CSV Files (*.csv)"
         )
         
         if file_path:
-            self._save_to_csv(self.scraped_businesses, file_path)
-            QMessageBox.information(self, "Success", f"Saved {len(self.scraped_businesses)} businesses to {file_path}")
+            self._save_to_csv(list(self.scraped_businesses), file_path, "Saved {count} businesses to {path}")
             
     def save_unique_csv(self):
         """Save unique results to CSV"""
-        if not self.scraped_businesses:
+        if not self.unique_businesses_map:
             QMessageBox.warning(self, "No Data", "No businesses to save")
             return
         
-        # Remove duplicates based on business name and address
-        unique_businesses = []
-        seen = set()
-        
-        for business in self.scraped_businesses:
-            key = (business.get('name', '').lower(), business.get('address', '').lower())
-            if key not in seen and key != ('', ''):
-                seen.add(key)
-                unique_businesses.append(business)
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save Unique Results", 
-            str(Path.home() / "Desktop" / "unique_businesses.csv"),
+            str(self._desktop_dir / "unique_businesses.csv"),
             "CSV Files (*.csv)"
         )
         
         if file_path:
-            self._save_to_csv(unique_businesses, file_path)
-            QMessageBox.information(self, "Success", f"Saved {len(unique_businesses)} unique businesses to {file_path}")
+            self._save_to_csv(
+                list(self.unique_businesses_map.values()), file_path,
+                "Saved {count} unique businesses to {path}"
+            )
             
-    def _save_to_csv(self, businesses, file_path):
-        """Save businesses to CSV file"""
-        try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['keyword', 'name', 'address', 'phone', 'website', 'rating', 'reviews', 'category']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for business in businesses:
-                    writer.writerow(business)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save CSV: {str(e)}")
+    def _save_to_csv(self, businesses, file_path, success_message):
+        """Save businesses to CSV file on a background thread"""
+        worker = CSVSaveWorker(businesses, file_path)
+        self._csv_save_workers.add(worker)
+        
+        def on_finished(count, path):
+            self._csv_save_workers.discard(worker)
+            QMessageBox.information(self, "Success", success_message.format(count=count, path=path))
+            
+        def on_error(error):
+            self._csv_save_workers.discard(worker)
+            QMessageBox.critical(self, "Error", f"Failed to save CSV: {error}")
+            
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        QThreadPool.globalInstance().start(worker)
             
     def clear_results(self):
         """Clear all results"""
-        self.scraped_businesses = []
-        self.results_table.setRowCount(0)
+        self.scraped_businesses = deque()
+        self.unique_businesses_map = {}
+        self._pending_rows = []
+        self.results_model.clear()
+        self._log_buffer.clear()
         self.progress_log.clear()
         self.total_businesses = 0
         self.unique_businesses = 0
+        self._last_total = 0
+        self._last_unique = 0
         self.update_stats()
         
         # Reset dashboard
@@ -1972,42 +2034,57 @@ class ModernScraperGUI(QMainWindow):
         
         self.log_progress("🗑️ Results cleared")
         
-    def log_progress(self, message: str):
-        """Log progress message"""
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.progress_log.append(formatted_message)
-        self.status_bar.showMessage(message)
+    def _timestamp(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._timestamp_text
         
-    def add_business_to_table(self, business_data: dict):
-        """Add business to the results table"""
-        self.scraped_businesses.append(business_data)
+    def log_progress(self, message: str):
+        """Log progress message (the scraper sends several, newline-separated)"""
+        timestamp = self._timestamp()
+        lines = message.split('\n')
+        self._log_buffer.extend(f"[{timestamp}] {line}" for line in lines)
+        self._last_log_message = lines[-1]
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(100)
+            
+    def _flush_progress_log(self):
+        """Append buffered progress messages with a single layout pass"""
+        if not self._log_buffer:
+            return
+        self.progress_log.appendPlainText('\n'.join(self._log_buffer))
+        self._log_buffer.clear()
+        self.status_bar.showMessage(self._last_log_message)
         
-        # Add to table
-        row = self.results_table.rowCount()
-        self.results_table.insertRow(row)
+    def add_businesses_to_table(self, batch: list):
+        """Add a batch of businesses to the results table"""
+        self.scraped_businesses.extend(batch)
         
-        columns = ["keyword", "name", "website", "phone", "address", "rating", "category"]
+        # Table rows are added by _flush_pending_rows at most every 200 ms
+        self._pending_rows.extend(batch)
+        if not self._row_flush_timer.isActive():
+            self._row_flush_timer.start(200)
         
-        for col, field in enumerate(columns):
-            item = QTableWidgetItem(str(business_data.get(field, '')))
-            self.results_table.setItem(row, col, item)
+        # Only the new batch is checked against the names/addresses seen so far;
+        # each Business carries its precomputed dedup key
+        for business_data in batch:
+            self.unique_businesses_map.setdefault(business_data.key, business_data)
         
         # Update stats
         self.total_businesses = len(self.scraped_businesses)
-        
-        # Calculate unique businesses
-        seen = set()
-        unique_count = 0
-        for business in self.scraped_businesses:
-            key = (business.get('name', '').lower(), business.get('address', '').lower())
-            if key not in seen and key != ('', ''):
-                seen.add(key)
-                unique_count += 1
-        
-        self.unique_businesses = unique_count
+        self.unique_businesses = len(self.unique_businesses_map)
         self.update_stats()
         
+    def _flush_pending_rows(self):
+        """Append all buffered businesses to the results table in one pass"""
+        if not self._pending_rows:
+            return
+        rows, self._pending_rows = self._pending_rows, []
+        self.results_model.append_rows(rows)
+        
     def update_stats(self):
         """Update statistics display"""
         pass
@@ -2015,7 +2092,7 @@ class ModernScraperGUI(QMainWindow):
     def update_dashboard_activity(self, message: str):
         """Update dashboard activity log"""
         if hasattr(self, 'dashboard_activity_log'):
-            timestamp = time.strftime("%H:%M:%S")
+            timestamp = self._timestamp()
             formatted_message = f"[{timestamp}] {message}"
             self.dashboard_activity_log.append(formatted_message)
             # Keep only last 50 messages for performance
@@ -2026,28 +2103,36 @@ class ModernScraperGUI(QMainWindow):
                 cursor.removeSelectedText()
                 cursor.deletePreviousChar()  # Remove the newline
     
-    def update_dashboard_stats(self, business_data: dict):
-        """Update dashboard statistics when a new business is found"""
+    def update_dashboard_stats(self, batch: list):
+        """Schedule a dashboard statistics refresh when new businesses are found"""
+        if not self._stats_refresh_timer.isActive():
+            self._stats_refresh_timer.start(100)
+            
+    def _refresh_dashboard_stats(self):
+        """Show the current totals on the dashboard stat cards"""
         if hasattr(self, 'total_businesses_card'):
             # Find the value labels in the stat cards
             total_value = self.total_businesses_card.findChild(QLabel, "statValue")
             unique_value = self.unique_businesses_card.findChild(QLabel, "statValue")
             success_value = self.success_rate_card.findChild(QLabel, "statValue")
             
-            if total_value:
+            # Skip label updates (and the restyle/repaint they trigger) when nothing changed
+            total_changed = self.total_businesses != self._last_total
+            unique_changed = self.unique_businesses != self._last_unique
+            
+            if total_value and total_changed:
                 total_value.setText(str(self.total_businesses))
-            if unique_value:
+            if unique_value and unique_changed:
                 unique_value.setText(str(self.unique_businesses))
-            if success_value and self.total_businesses > 0:
+            if success_value and self.total_businesses > 0 and (total_changed or unique_changed):
                 success_rate = (self.unique_businesses / self.total_businesses) * 100
                 success_value.setText(f"{success_rate:.1f}%")
             
-            # Update progress bar
+            self._last_total = self.total_businesses
+            self._last_unique = self.unique_businesses
+            
+            # The bar's value tracks completed keywords; only its label follows the totals
             if hasattr(self, 'scraping_thread') and self.scraping_thread:
-                total_keywords = len(self.scraping_thread.keywords)
-                # Estimate progress based on current activity
-                current_progress = min(95, (self.total_businesses / max(1, total_keywords * 10)) * 100)
-                self.dashboard_progress_bar.setValue(int(current_progress))
                 self.dashboard_progress_bar.setFormat(f"Processing... {self.total_businesses} businesses found")
     
     def update_dashboard_keyword(self, keyword: str):
@@ -2058,18 +2143,8 @@ class ModernScraperGUI(QMainWindow):
             if keyword_value:
                 keyword_value.setText(keyword)
             
-            # Update keywords processed count
+            # Progress itself advances in update_keyword_progress as keywords finish
             if hasattr(self, 'scraping_thread') and self.scraping_thread:
-                current_index = self.scraping_thread.keywords.index(keyword) + 1 if keyword in self.scraping_thread.keywords else 0
-                total_keywords = len(self.scraping_thread.keywords)
-                
-                processed_value = self.keywords_processed_card.findChild(QLabel, "statValue")
-                if processed_value:
-                    processed_value.setText(f"{current_index}/{total_keywords}")
-                
-                # Update progress bar
-                progress = (current_index / total_keywords) * 100 if total_keywords > 0 else 0
-                self.dashboard_progress_bar.setValue(int(progress))
                 self.dashboard_progress_bar.setFormat(f"Processing: {keyword}")
                 
                 # Update status
@@ -2077,12 +2152,28 @@ class ModernScraperGUI(QMainWindow):
                 if status_value:
                     status_value.setText("🔄 Scraping")
         
+    def update_keyword_progress(self, completed: int, total: int):
+        """Advance the dashboard progress as keywords finish"""
+        if hasattr(self, 'keywords_processed_card'):
+            processed_value = self.keywords_processed_card.findChild(QLabel, "statValue")
+            if processed_value:
+                processed_value.setText(f"{completed}/{total}")
+        
+        if hasattr(self, 'dashboard_progress_bar'):
+            progress = (completed / total) * 100 if total > 0 else 0
+            self.dashboard_progress_bar.setValue(int(progress))
+        
     def update_current_keyword(self, keyword: str):
         """Update the current keyword display"""
         pass
         
     def scraping_finished(self, result_count):
         """Handle scraping completion"""
+        # Show final totals now so a pending refresh cannot overwrite the completed state
+        if self._stats_refresh_timer.isActive():
+            self._stats_refresh_timer.stop()
+            self._refresh_dashboard_stats()
+        
         self.log_progress(f"🎉 Scraping completed! Total businesses found: {result_count}")
         
         # Update dashboard status to completed
@@ -2098,7 +2189,7 @@ class ModernScraperGUI(QMainWindow):
         
         # Add completion message to dashboard activity
         if hasattr(self, 'dashboard_activity_log'):
-            timestamp = time.strftime("%H:%M:%S")
+            timestamp = self._timestamp()
             self.dashboard_activity_log.append(f"[{timestamp}] 🎉 Scraping completed! Found {result_count} businesses")
         
         # Reset button states
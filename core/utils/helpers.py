@@ -14,10 +14,20 @@ import uuid
 import platform
 import time
 import json
+import re
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime
 
+# Compiled once at import instead of on every validation call
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_URL_RE = re.compile(r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_KEYWORD_INVALID_RE = re.compile(r'[<>"\\]')
+
 
 class LocationDataLoader:
     """Handler for loading and processing location data"""
@@ -306,7 +316,6 @@ class SystemInfo:
             
             # Try to get MAC address
             try:
-                import uuid
                 mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
                                for elements in range(0, 2*6, 2)][::-1])
                 system_info['mac'] = mac
@@ -435,11 +444,10 @@ class FileUtils:
         Returns:
             Safe filename
         """
-        import re
         # Remove invalid characters
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        safe_name = _UNSAFE_FILENAME_RE.sub('_', filename)
         # Remove multiple underscores
-        safe_name = re.sub(r'_+', '_', safe_name)
+        safe_name = _UNDERSCORE_RUN_RE.sub('_', safe_name)
         # Remove leading/trailing underscores
         safe_name = safe_name.strip('_')
         return safe_name or 'untitled'
@@ -589,9 +597,7 @@ class ValidationUtils:
         Returns:
             True if valid email
         """
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
     
     @staticmethod
     def is_valid_phone(phone: str) -> bool:
@@ -603,9 +609,8 @@ class ValidationUtils:
         Returns:
             True if valid phone number
         """
-        import re
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = _NON_DIGIT_RE.sub('', phone)
         # Check if it has 10-15 digits (international format)
         return 10 <= len(digits_only) <= 15
     
@@ -619,9 +624,7 @@ class ValidationUtils:
         Returns:
             True if valid URL
         """
-        import re
-        pattern = r'^https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?$'
-        return bool(re.match(pattern, url))
+        return bool(_URL_RE.match(url))
     
     @staticmethod
     def clean_text(text: str) -> str:
@@ -640,8 +643,7 @@ class ValidationUtils:
         cleaned = ' '.join(text.split())
         
         # Remove control characters
-        import re
-        cleaned = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned)
+        cleaned = _CONTROL_CHARS_RE.sub('', cleaned)
         
         return cleaned.strip()
     
@@ -667,8 +669,7 @@ class ValidationUtils:
             return False, "Keyword must be less than 100 characters"
         
         # Check for invalid characters
-        import re
-        if re.search(r'[<>"\\]', keyword):
+        if _KEYWORD_INVALID_RE.search(keyword):
             return False, "Keyword contains invalid characters"
         
         return True, ""
\ No newline at end of file
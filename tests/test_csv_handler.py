@@ -0,0 +1,19 @@
+import csv
+
+from core.database import Business, CSVHandler
+
+
+def test_write_businesses_replaces_unencodable_text(tmp_path):
+    path = tmp_path / 'out.csv'
+    businesses = [
+        Business(keyword='cafe', name='Caf\ud800', address='1 Main St, Town'),
+        {'keyword': 'cafe', 'name': 'Plain', 'phone': '555-0100'},
+    ]
+
+    CSVHandler.write_businesses(businesses, str(path))
+
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['keyword', 'name', 'address', 'phone', 'website', 'rating', 'reviews', 'category']
+    assert rows[1][:3] == ['cafe', 'Caf?', '1 Main St, Town']
+    assert rows[2][:4] == ['cafe', 'Plain', '', '555-0100']
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from core.config import AppSettings, ConfigManager
+
+
+def _settings(config_dir, stored=None):
+    if stored is not None:
+        (config_dir / 'config.json').write_text(json.dumps(stored), encoding='utf-8')
+    return AppSettings(ConfigManager(str(config_dir)))
+
+
+def test_max_concurrent_defaults_to_five(tmp_path):
+    assert _settings(tmp_path).max_concurrent == 5
+
+
+@pytest.mark.parametrize('stored, expected', [(0, 1), (-3, 1), (99, 16), (8, 8)])
+def test_max_concurrent_clamps_stored_value(tmp_path, stored, expected):
+    settings = _settings(tmp_path, {'config_version': 2, 'scraping': {'max_concurrent': stored}})
+    assert settings.max_concurrent == expected
+
+
+@pytest.mark.parametrize('value', [0, 17])
+def test_max_concurrent_setter_rejects_out_of_range(tmp_path, value):
+    settings = _settings(tmp_path)
+    with pytest.raises(ValueError):
+        settings.max_concurrent = value
+    assert settings.max_concurrent == 5
+
+
+def test_old_default_concurrency_is_migrated(tmp_path):
+    settings = _settings(tmp_path, {'scraping': {'max_concurrent': 1}})
+    assert settings.max_concurrent == 5
+
+
+def test_versioned_concurrency_of_one_is_kept(tmp_path):
+    settings = _settings(tmp_path, {'config_version': 2, 'scraping': {'max_concurrent': 1}})
+    assert settings.max_concurrent == 1